@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from pathlib import Path
 
 import typer
@@ -9,51 +10,77 @@ app = typer.Typer()
 console = Console()
 
 
-@app.command()
-def docker():
-    """Create a Docker Compose file to run self-hostable parsers (experimental)."""
+def confirm_overwrite() -> bool:
+    """
+    Prompt user to confirm overwriting an existing file.
+
+    Returns:
+        True if user confirms, False otherwise
+    """
+    return typer.confirm('Do you want to overwrite it?', default=False)
+
+
+def create_compose(
+    directory: Path, confirm: Callable[[], bool] = confirm_overwrite
+) -> bool:
+    """
+    Write the example Docker Compose and OpenTelemetry collector configuration.
+
+    Args:
+        directory: Directory in which the files are created
+        confirm: Callable asked before overwriting an existing file
+
+    Returns:
+        True if the files were written, False if an existing file was kept
+    """
 
     from importlib.resources import files
 
     # Get the example file content from the package
-    try:
-        example_compose_content = (
-            files('parxy_cli').joinpath('compose.example.yaml').read_text()
-        )
-        example_otel_content = (
-            files('parxy_cli')
-            .joinpath('otel-collector-config.example.yaml')
-            .read_text()
-        )
+    example_compose_content = (
+        files('parxy_cli').joinpath('compose.example.yaml').read_text()
+    )
+    example_otel_content = (
+        files('parxy_cli').joinpath('otel-collector-config.example.yaml').read_text()
+    )
 
-        console.action('Create compose.yaml file')
+    console.action('Create compose.yaml file')
 
-        compose_file_path: Path = Path.cwd() / 'compose.yaml'
+    compose_file_path: Path = directory / 'compose.yaml'
 
-        otel_file_path: Path = Path.cwd() / 'otel-collector-config.yaml'
+    otel_file_path: Path = directory / 'otel-collector-config.yaml'
 
-        # Check if compose.yaml already exists
-        if compose_file_path.exists():
-            console.highlight('compose.yaml file already exists')
-            console.newline()
-            overwrite = typer.confirm('Do you want to overwrite it?', default=False)
-            if not overwrite:
-                console.faint('Leaving compose.yaml as is.')
-                return
+    # Check if compose.yaml already exists
+    if compose_file_path.exists():
+        console.highlight('compose.yaml file already exists')
+        console.newline()
+        if not confirm():
+            console.faint('Leaving compose.yaml as is.')
+            return False
+
+    # Write the content to compose.yaml
+    compose_file_path.write_text(example_compose_content)
+
+    if otel_file_path.exists():
+        console.highlight('otel-collector-config.yaml file already exists')
+        console.newline()
+        if not confirm():
+            console.faint('Leaving otel-collector-config.yaml as is.')
+            return False
+
+    # Write the content to otel-collector-config.yaml
+    otel_file_path.write_text(example_otel_content)
 
-        # Write the content to compose.yaml
-        compose_file_path.write_text(example_compose_content)
+    return True
 
-        if otel_file_path.exists():
-            console.highlight('otel-collector-config.yaml file already exists')
-            console.newline()
-            overwrite = typer.confirm('Do you want to overwrite it?', default=False)
-            if not overwrite:
-                console.faint('Leaving otel-collector-config.yaml as is.')
-                return
 
-        # Write the content to compose.yaml
-        otel_file_path.write_text(example_otel_content)
+@app.command()
+def docker():
+    """Create a Docker Compose file to run self-hostable parsers (experimental)."""
+
+    try:
+        if not create_compose(Path.cwd()):
+            return
 
         console.print(
             '[success]Created compose.yaml[/success] file with default configuration.'
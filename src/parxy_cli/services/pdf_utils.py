@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import List, Tuple, Optional
 
 
+# Input with a page range suffix, e.g. file.pdf[3:5]
+PAGE_RANGE_PATTERN = re.compile(r'^(.+?)\[([^\]]+)\]$')
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Convert bytes to human-readable format.
@@ -58,8 +62,8 @@ def is_binary_file(content: bytes) -> bool:
     Returns:
         True if binary, False if likely text
     """
-    check_bytes = content[:8192]
-    return b'\x00' in check_bytes
+    # Search within the first 8KB without copying them to a new bytes object
+    return content.find(b'\x00', 0, 8192) != -1
 
 
 def parse_input_with_pages(
@@ -83,8 +87,7 @@ def parse_input_with_pages(
         from_page and to_page are None if no range specified or represent the range to use.
     """
     # Match pattern: filename[range]
-    pattern = r'^(.+?)\[([^\]]+)\]$'
-    match = re.match(pattern, input_str)
+    match = PAGE_RANGE_PATTERN.match(input_str)
 
     if not match:
         # No page range specified
@@ -0,0 +1,66 @@
+"""Shared fixtures for the command tests."""
+
+import shutil
+
+import pytest
+from typer.testing import CliRunner
+
+
+class ParxyStub:
+    """Stand-in for the Parxy facade recording the batch_iter calls."""
+
+    def __init__(self):
+        self.driver = 'pymupdf'
+        self.results = []
+        self.calls = []
+
+    def default_driver(self):
+        return self.driver
+
+    def batch_iter(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.results
+
+
+@pytest.fixture(scope='session')
+def runner():
+    """Fixture providing a CLI runner shared by all command tests."""
+    return CliRunner()
+
+
+@pytest.fixture(scope='session')
+def _pdf_template(tmp_path_factory):
+    """Write the placeholder PDF content once per session."""
+    pdf = tmp_path_factory.mktemp('template') / 'test.pdf'
+    pdf.write_bytes(b'%PDF-1.4 fake content')
+    return pdf
+
+
+@pytest.fixture
+def pdf_file(tmp_path, _pdf_template):
+    """Fixture providing a placeholder PDF file in the test directory."""
+    pdf = tmp_path / 'test.pdf'
+    shutil.copy(_pdf_template, pdf)
+    return pdf
+
+
+@pytest.fixture
+def make_pdf_files(tmp_path, _pdf_template):
+    """Fixture providing a factory of placeholder PDF files in the test directory."""
+
+    def make(*names):
+        files = [tmp_path / name for name in names]
+        for pdf in files:
+            shutil.copy(_pdf_template, pdf)
+        return files
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def mock_parxy(monkeypatch):
+    """Fixture replacing the Parxy facade used by the parse and markdown commands."""
+    stub = ParxyStub()
+    monkeypatch.setattr('parxy_cli.commands.parse.Parxy', stub)
+    monkeypatch.setattr('parxy_cli.commands.markdown.Parxy', stub)
+    return stub
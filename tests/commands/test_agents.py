@@ -5,17 +5,10 @@ from unittest.mock import patch
 
 import pytest
 from click.utils import strip_ansi
-from typer.testing import CliRunner
 
 from parxy_cli.commands.agents import app
 
 
-@pytest.fixture
-def runner():
-    """Fixture providing a CLI runner."""
-    return CliRunner()
-
-
 @pytest.fixture
 def mock_template_content():
     """Fixture providing mock agents template content."""
@@ -1,108 +1,135 @@
 """Test suite for the docker command."""
 
 from unittest.mock import patch
-from pathlib import Path
 import pytest
-from typer.testing import CliRunner
 from click.utils import strip_ansi
 
-from parxy_cli.commands.docker import app
+from parxy_cli.commands.docker import app, create_compose
 
 
 @pytest.fixture
-def runner():
-    """Fixture providing a CLI runner."""
-    return CliRunner()
+def workdir(tmp_path, monkeypatch):
+    """Fixture running the test inside its own temporary working directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
-@pytest.fixture
-def mock_compose_content():
-    """Fixture providing mock docker-compose file content."""
-    return """version: '3'
+MOCK_COMPOSE_CONTENT = """version: '3'
 services:
   pdfact:
     image: oneofftech/pdfact:latest
 """
 
+EXISTING_COMPOSE_CONTENT = "version: '3'\nservices: {}"
 
-def test_docker_command_creates_compose_file(runner, mock_compose_content):
-    """Test that the docker command creates a compose.yaml file when it doesn't exist."""
 
-    with patch('importlib.resources.files') as mock_files, runner.isolated_filesystem():
-        # Setup mock to return our example content
-        mock_files.return_value.joinpath.return_value.read_text.return_value = (
-            mock_compose_content
-        )
+class StubResources:
+    """Stand-in for importlib.resources.files() serving fixed file content."""
 
-        # Run the command
-        result = runner.invoke(app)
+    def __init__(self, content='', error=None):
+        self._content = content
+        self._error = error
 
-        # Assert command executed successfully
-        assert result.exit_code == 0
+    def joinpath(self, *args):
+        return self
 
-        # Clean ANSI codes and verify success message
-        cleaned_output = strip_ansi(result.stdout)
-        assert 'Created compose.yaml file with default configuration' in cleaned_output
-        assert 'Execute docker compose pull' in cleaned_output
+    def read_text(self, *args, **kwargs):
+        if self._error is not None:
+            raise self._error
+        return self._content
 
-        # Verify file was created with correct content
-        compose_file = Path.cwd() / 'compose.yaml'
-        assert compose_file.exists()
-        assert compose_file.read_text() == mock_compose_content
 
-        # Verify file was created with correct content
-        otel_file = Path.cwd() / 'otel-collector-config.yaml'
-        assert otel_file.exists()
+@pytest.fixture(autouse=True, scope='module')
+def mock_files():
+    """Fixture serving mock docker-compose content as the package example files."""
+    resources = StubResources(MOCK_COMPOSE_CONTENT)
+    with patch('importlib.resources.files', new=lambda package: resources):
+        yield resources
 
 
-def test_docker_command_asks_for_confirmation_when_compose_exists(
-    runner, mock_compose_content
+def test_docker_command_creates_compose_file(runner, workdir):
+    """Test that the docker command creates a compose.yaml file when it doesn't exist."""
+
+    # Run the command
+    result = runner.invoke(app)
+
+    # Assert command executed successfully
+    assert result.exit_code == 0
+
+    # The success message is styled mid-sentence, clean ANSI codes before matching
+    cleaned_output = strip_ansi(result.stdout)
+    assert 'Created compose.yaml file with default configuration' in cleaned_output
+    assert 'Execute docker compose pull' in cleaned_output
+
+    # Verify file was created with correct content
+    compose_file = workdir / 'compose.yaml'
+    assert compose_file.exists()
+    assert compose_file.read_text() == MOCK_COMPOSE_CONTENT
+
+    # Verify file was created with correct content
+    otel_file = workdir / 'otel-collector-config.yaml'
+    assert otel_file.exists()
+
+
+@pytest.mark.parametrize(
+    'overwrite,expected_content',
+    [(False, EXISTING_COMPOSE_CONTENT), (True, MOCK_COMPOSE_CONTENT)],
+)
+def test_create_compose_asks_for_confirmation_when_compose_exists(
+    workdir, capsys, overwrite, expected_content
 ):
-    """Test that the docker command asks for confirmation when compose.yaml already exists."""
+    """Test that create_compose asks for confirmation when compose.yaml already exists."""
+    # Create existing compose.yaml file
+    compose_file = workdir / 'compose.yaml'
+    compose_file.write_text(EXISTING_COMPOSE_CONTENT)
+
+    # Simulate the answer to the overwrite prompt
+    assert create_compose(workdir, confirm=lambda: overwrite) is overwrite
 
-    with patch('importlib.resources.files') as mock_files, runner.isolated_filesystem():
-        # Create existing compose.yaml file
-        compose_file = Path.cwd() / 'compose.yaml'
-        compose_file.write_text("version: '3'\nservices: {}")
+    # Verify warning message and abort message when declined
+    output = capsys.readouterr().out
+    assert 'compose.yaml file already exists' in output
+    assert ('Leaving compose.yaml as is' in output) is not overwrite
 
-        mock_files.return_value.joinpath.return_value.read_text.return_value = (
-            mock_compose_content
-        )
+    # Verify file was kept or overwritten
+    assert compose_file.read_text() == expected_content
 
-        # Run command and simulate "no" to overwrite prompt
-        result = runner.invoke(app, input='n\n')
 
-        # Clean ANSI codes and verify warning and abort messages
-        cleaned_output = strip_ansi(result.stdout)
-        assert 'compose.yaml file already exists' in cleaned_output
-        assert 'Leaving compose.yaml as is' in cleaned_output
+@pytest.mark.parametrize(
+    'answer,expected_content',
+    [('n', EXISTING_COMPOSE_CONTENT), ('y', MOCK_COMPOSE_CONTENT)],
+)
+def test_docker_command_asks_for_confirmation_when_compose_exists(
+    runner, workdir, answer, expected_content
+):
+    """Test that the docker command prompts before overwriting compose.yaml."""
 
-        # Verify original file was not modified
-        assert compose_file.read_text() == "version: '3'\nservices: {}"
+    # Create existing compose.yaml and otel files
+    compose_file = workdir / 'compose.yaml'
+    compose_file.write_text(EXISTING_COMPOSE_CONTENT)
+    (workdir / 'otel-collector-config.yaml').write_text(EXISTING_COMPOSE_CONTENT)
 
-        # Run command again and simulate "yes" to overwrite prompt
-        result = runner.invoke(app, input='y\n')
+    # Answer the overwrite prompts
+    result = runner.invoke(app, input=f'{answer}\n{answer}\n')
 
-        # Verify file was overwritten with new content
-        assert compose_file.read_text() == mock_compose_content
+    assert result.exit_code == 0
+    assert 'Do you want to overwrite it?' in result.stdout
+    assert compose_file.read_text() == expected_content
 
 
-def test_docker_command_handles_errors(runner):
+def test_docker_command_handles_errors(runner, workdir):
     """Test that the docker command properly handles and displays errors."""
 
-    with patch('importlib.resources.files') as mock_files:
-        # Setup mock to raise an exception
-        mock_files.return_value.joinpath.return_value.read_text.side_effect = Exception(
-            'Test error'
-        )
+    # Setup stub to raise an exception
+    resources = StubResources(error=Exception('Test error'))
 
+    with patch('importlib.resources.files', new=lambda package: resources):
         # Run the command
         result = runner.invoke(app)
 
         # Command should exit with non-zero status
         assert result.exit_code == 1
 
-        # Clean ANSI codes and verify error message
-        cleaned_output = strip_ansi(result.stdout)
-        assert 'Error creating compose.yaml file' in cleaned_output
-        assert 'Test error' in cleaned_output
+        # Verify error message
+        assert 'Error creating compose.yaml file' in result.stdout
+        assert 'Test error' in result.stdout
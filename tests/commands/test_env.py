@@ -3,19 +3,12 @@
 from unittest.mock import patch, MagicMock
 import pytest
 from pathlib import Path
-from typer.testing import CliRunner
 from click.utils import strip_ansi
 
 from parxy_cli.commands.env import app
 
 
-@pytest.fixture
-def runner():
-    """Fixture providing a CLI runner."""
-    return CliRunner()
-
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_env_content():
     """Fixture providing mock env file content."""
     return """PARXY_DEFAULT_DRIVER=pymupdf
@@ -23,16 +16,23 @@ PARXY_LOGGING_LEVEL=INFO
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_resources():
-    """Fixture providing a mock for importlib.resources."""
+    """Fixture providing a mock for importlib.resources, patched once per module."""
     with patch('importlib.resources.files') as mock_files:
-        mock_path = MagicMock()
-        mock_path.read_text.return_value = None
-        mock_files.return_value.joinpath.return_value = mock_path
         yield mock_files
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_resources(mock_resources):
+    """Fixture resetting the shared importlib.resources mock before each test."""
+    mock_resources.reset_mock(return_value=True, side_effect=True)
+
+    mock_path = MagicMock()
+    mock_path.read_text.return_value = None
+    mock_resources.return_value.joinpath.return_value = mock_path
+
+
 def test_env_command_creates_env_file(runner, mock_env_content, mock_resources):
     """Test that the env command creates a .env file when it doesn't exist."""
 
@@ -1,20 +1,17 @@
 """Test suite for the parse command."""
 
-from unittest.mock import patch
 import pytest
-from typer.testing import CliRunner
 
-from parxy_cli.commands.parse import app, collect_files, collect_files_with_depth
+from parxy_cli.commands.parse import (
+    app,
+    collect_files,
+    collect_files_with_depth,
+    parse,
+)
 from parxy_core.models import Document, Page, BatchResult
 
 
-@pytest.fixture
-def runner():
-    """Fixture providing a CLI runner."""
-    return CliRunner()
-
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_document():
     """Fixture providing a mock document with a single page."""
     return Document(
@@ -22,302 +19,265 @@ def mock_document():
     )
 
 
-def test_parse_command_calls_facade_correctly(runner, mock_document, tmp_path):
-    """Test that the parse command correctly invokes the Parxy facade."""
+@pytest.fixture(scope='session')
+def pdf_tree(tmp_path_factory):
+    """Fixture providing a read-only directory tree with PDF files on three levels."""
+    root = tmp_path_factory.mktemp('tree')
+    (root / 'doc1.pdf').write_text('test')
+    (root / 'level1').mkdir()
+    (root / 'level1' / 'doc2.pdf').write_text('test')
+    (root / 'level1' / 'level2').mkdir()
+    (root / 'level1' / 'level2' / 'doc3.pdf').write_text('test')
+    return root
 
-    # Create a test PDF file
-    test_file = tmp_path / 'test.pdf'
-    test_file.write_text('dummy pdf content')
 
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.default_driver.return_value = 'pymupdf'
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file),
-                    driver='pymupdf',
-                    document=mock_document,
-                    error=None,
-                )
-            ]
-        )
+def test_parse_command_calls_facade_correctly(mock_document, pdf_file, mock_parxy):
+    """Test that the parse command correctly invokes the Parxy facade."""
 
-        result = runner.invoke(app, [str(test_file)])
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(pdf_file),
+                driver='pymupdf',
+                document=mock_document,
+                error=None,
+            )
+        ]
+    )
 
-        assert result.exit_code == 0
+    # Only the facade call is verified, call the command function directly
+    parse([str(pdf_file)])
 
-        mock_parxy.batch_iter.assert_called_once_with(
-            tasks=[str(test_file)],
-            drivers=['pymupdf'],
-            level='block',
-            workers=None,
-        )
+    assert mock_parxy.calls == [
+        {
+            'tasks': [str(pdf_file)],
+            'drivers': ['pymupdf'],
+            'level': 'block',
+            'workers': None,
+        }
+    ]
 
 
-def test_parse_command_with_custom_options(runner, mock_document, tmp_path):
+def test_parse_command_with_custom_options(runner, mock_document, pdf_file, mock_parxy):
     """Test that the parse command correctly handles custom options."""
 
-    # Create a test PDF file
-    test_file = tmp_path / 'test.pdf'
-    test_file.write_text('dummy pdf content')
-
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file),
-                    driver='llamaparse',
-                    document=mock_document,
-                    error=None,
-                )
-            ]
-        )
-
-        result = runner.invoke(
-            app,
-            [
-                str(test_file),
-                '--driver',
-                'llamaparse',
-                '--level',
-                'block',
-                '--mode',
-                'plain',
-            ],
-        )
-
-        assert result.exit_code == 0
-
-        mock_parxy.batch_iter.assert_called_once_with(
-            tasks=[str(test_file)],
-            drivers=['llamaparse'],
-            level='block',
-            workers=None,
-        )
-
-
-def test_parse_command_with_output_directory(runner, mock_document, tmp_path):
-    """Test that the parse command correctly handles file output."""
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(pdf_file),
+                driver='llamaparse',
+                document=mock_document,
+                error=None,
+            )
+        ]
+    )
 
-    # Create a test PDF file
-    test_file = tmp_path / 'test.pdf'
-    test_file.write_text('dummy pdf content')
+    result = runner.invoke(
+        app,
+        [
+            str(pdf_file),
+            '--driver',
+            'llamaparse',
+            '--level',
+            'page',
+            '--mode',
+            'plain',
+        ],
+    )
 
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.default_driver.return_value = 'pymupdf'
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file),
-                    driver='pymupdf',
-                    document=mock_document,
-                    error=None,
-                )
-            ]
-        )
+    assert result.exit_code == 0
 
-        # Create output path using tmp_path fixture
-        output_dir = tmp_path / 'output'
+    # The plain mode writes a text file
+    assert (pdf_file.parent / 'llamaparse-test.txt').exists()
 
-        # Run command with output directory
-        result = runner.invoke(app, [str(test_file), '--output', str(output_dir)])
+    assert mock_parxy.calls == [
+        {
+            'tasks': [str(pdf_file)],
+            'drivers': ['llamaparse'],
+            'level': 'page',
+            'workers': None,
+        }
+    ]
 
-        assert result.exit_code == 0
 
-        # Verify the output file was created (default mode is JSON)
-        output_file = output_dir / 'pymupdf-test.json'
-        assert output_file.exists()
+def test_parse_command_with_output_directory(
+    runner, mock_document, tmp_path, pdf_file, mock_parxy
+):
+    """Test that the parse command correctly handles file output."""
 
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(pdf_file),
+                driver='pymupdf',
+                document=mock_document,
+                error=None,
+            )
+        ]
+    )
 
-def test_parse_command_with_markdown_output(runner, mock_document, tmp_path):
-    """Test that the parse command correctly handles markdown output."""
+    # Create output path using tmp_path fixture
+    output_dir = tmp_path / 'output'
 
-    # Create a test PDF file
-    test_file = tmp_path / 'test.pdf'
-    test_file.write_text('dummy pdf content')
+    # Run command with output directory
+    result = runner.invoke(app, [str(pdf_file), '--output', str(output_dir)])
 
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.default_driver.return_value = 'pymupdf'
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file),
-                    driver='pymupdf',
-                    document=mock_document,
-                    error=None,
-                )
-            ]
-        )
+    assert result.exit_code == 0
 
-        # Create output path using tmp_path fixture
-        output_dir = tmp_path / 'output'
+    # Verify the output file was created (default mode is JSON)
+    output_file = output_dir / 'pymupdf-test.json'
+    assert output_file.exists()
 
-        # Run command with markdown mode
-        result = runner.invoke(
-            app, [str(test_file), '--output', str(output_dir), '--mode', 'markdown']
-        )
 
-        assert result.exit_code == 0
+def test_parse_command_with_markdown_output(
+    runner, mock_document, tmp_path, pdf_file, mock_parxy
+):
+    """Test that the parse command correctly handles markdown output."""
 
-        # Verify the output file was created with .md extension
-        output_file = output_dir / 'pymupdf-test.md'
-        assert output_file.exists()
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(pdf_file),
+                driver='pymupdf',
+                document=mock_document,
+                error=None,
+            )
+        ]
+    )
 
+    # Create output path using tmp_path fixture
+    output_dir = tmp_path / 'output'
 
-def test_parse_command_handles_errors(runner, tmp_path):
-    """Test that the parse command properly handles and displays errors."""
+    # Run command with markdown mode
+    result = runner.invoke(
+        app, [str(pdf_file), '--output', str(output_dir), '--mode', 'markdown']
+    )
+
+    assert result.exit_code == 0
+
+    # Verify the output file was created with .md extension
+    output_file = output_dir / 'pymupdf-test.md'
+    assert output_file.exists()
 
-    # Create a test PDF file
-    test_file = tmp_path / 'test.pdf'
-    test_file.write_text('dummy pdf content')
 
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.default_driver.return_value = 'pymupdf'
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file),
-                    driver='pymupdf',
-                    document=None,
-                    error='Test error',
-                )
-            ]
-        )
+def test_parse_command_handles_errors(runner, pdf_file, mock_parxy):
+    """Test that the parse command properly handles and displays errors."""
+
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(pdf_file),
+                driver='pymupdf',
+                document=None,
+                error='Test error',
+            )
+        ]
+    )
 
-        result = runner.invoke(app, [str(test_file)])
+    result = runner.invoke(app, [str(pdf_file)])
 
-        # The command shows a warning but continues
-        assert 'error' in result.stdout.lower()
+    # The command shows a warning but continues
+    assert 'error' in result.stdout.lower()
 
 
-def test_parse_command_with_multiple_drivers(runner, mock_document, tmp_path):
+def test_parse_command_with_multiple_drivers(
+    runner, mock_document, tmp_path, pdf_file, mock_parxy
+):
     """Test that the parse command correctly handles multiple drivers."""
 
-    # Create a test PDF file
-    test_file = tmp_path / 'test.pdf'
-    test_file.write_text('dummy pdf content')
-
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file),
-                    driver='pymupdf',
-                    document=mock_document,
-                    error=None,
-                ),
-                BatchResult(
-                    file=str(test_file),
-                    driver='llamaparse',
-                    document=mock_document,
-                    error=None,
-                ),
-            ]
-        )
-
-        # Create output path
-        output_dir = tmp_path / 'output'
-
-        # Run command with multiple drivers
-        result = runner.invoke(
-            app,
-            [
-                str(test_file),
-                '--output',
-                str(output_dir),
-                '--driver',
-                'pymupdf',
-                '--driver',
-                'llamaparse',
-            ],
-        )
-
-        assert result.exit_code == 0
-
-        # Verify that files with driver prefixes were created
-        assert (output_dir / 'pymupdf-test.json').exists()
-        assert (output_dir / 'llamaparse-test.json').exists()
-
-
-def test_collect_files_non_recursive(tmp_path):
-    """Test that collect_files only finds files in the given directory when not recursive."""
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(pdf_file),
+                driver='pymupdf',
+                document=mock_document,
+                error=None,
+            ),
+            BatchResult(
+                file=str(pdf_file),
+                driver='llamaparse',
+                document=mock_document,
+                error=None,
+            ),
+        ]
+    )
 
-    # Create test structure
-    (tmp_path / 'doc1.pdf').write_text('test')
-    (tmp_path / 'subdir').mkdir()
-    (tmp_path / 'subdir' / 'doc2.pdf').write_text('test')
+    # Create output path
+    output_dir = tmp_path / 'output'
+
+    # Run command with multiple drivers
+    result = runner.invoke(
+        app,
+        [
+            str(pdf_file),
+            '--output',
+            str(output_dir),
+            '--driver',
+            'pymupdf',
+            '--driver',
+            'llamaparse',
+        ],
+    )
+
+    assert result.exit_code == 0
+
+    # Verify that files with driver prefixes were created
+    assert (output_dir / 'pymupdf-test.json').exists()
+    assert (output_dir / 'llamaparse-test.json').exists()
+
+
+def test_collect_files_non_recursive(pdf_tree):
+    """Test that collect_files only finds files in the given directory when not recursive."""
 
-    files = collect_files([str(tmp_path)], recursive=False)
+    files = collect_files([str(pdf_tree)], recursive=False)
 
-    # Should only find doc1.pdf, not doc2.pdf in subdir
+    # Should only find doc1.pdf, not the files in subdirectories
     assert len(files) == 1
     assert files[0].name == 'doc1.pdf'
 
 
-def test_collect_files_recursive(tmp_path):
+def test_collect_files_recursive(pdf_tree):
     """Test that collect_files finds files in subdirectories when recursive=True."""
 
-    # Create test structure
-    (tmp_path / 'doc1.pdf').write_text('test')
-    (tmp_path / 'subdir').mkdir()
-    (tmp_path / 'subdir' / 'doc2.pdf').write_text('test')
+    files = collect_files([str(pdf_tree)], recursive=True)
 
-    files = collect_files([str(tmp_path)], recursive=True)
-
-    # Should find both files
-    assert len(files) == 2
+    # Should find all files
+    assert len(files) == 3
     file_names = {f.name for f in files}
-    assert file_names == {'doc1.pdf', 'doc2.pdf'}
+    assert file_names == {'doc1.pdf', 'doc2.pdf', 'doc3.pdf'}
 
 
-def test_collect_files_with_max_depth(tmp_path):
+def test_collect_files_with_max_depth(pdf_tree):
     """Test that collect_files respects max_depth parameter."""
 
-    # Create test structure with 3 levels
-    (tmp_path / 'doc1.pdf').write_text('test')
-    (tmp_path / 'level1').mkdir()
-    (tmp_path / 'level1' / 'doc2.pdf').write_text('test')
-    (tmp_path / 'level1' / 'level2').mkdir()
-    (tmp_path / 'level1' / 'level2' / 'doc3.pdf').write_text('test')
-
     # Test with max_depth=1 (should find doc1 and doc2, but not doc3)
-    files = collect_files([str(tmp_path)], recursive=True, max_depth=1)
+    files = collect_files([str(pdf_tree)], recursive=True, max_depth=1)
 
     assert len(files) == 2
     file_names = {f.name for f in files}
     assert file_names == {'doc1.pdf', 'doc2.pdf'}
 
 
-def test_collect_files_with_depth_helper(tmp_path):
+def test_collect_files_with_depth_helper(pdf_tree):
     """Test the collect_files_with_depth helper function."""
 
-    # Create test structure
-    (tmp_path / 'doc1.pdf').write_text('test')
-    (tmp_path / 'level1').mkdir()
-    (tmp_path / 'level1' / 'doc2.pdf').write_text('test')
-    (tmp_path / 'level1' / 'level2').mkdir()
-    (tmp_path / 'level1' / 'level2' / 'doc3.pdf').write_text('test')
-
     # Test with max_depth=0 (only current directory)
-    files = collect_files_with_depth(tmp_path, '*.pdf', max_depth=0)
+    files = collect_files_with_depth(pdf_tree, '*.pdf', max_depth=0)
     assert len(files) == 1
     assert files[0].name == 'doc1.pdf'
 
     # Test with max_depth=2 (should find all files)
-    files = collect_files_with_depth(tmp_path, '*.pdf', max_depth=2)
+    files = collect_files_with_depth(pdf_tree, '*.pdf', max_depth=2)
     assert len(files) == 3
     file_names = {f.name for f in files}
     assert file_names == {'doc1.pdf', 'doc2.pdf', 'doc3.pdf'}
 
 
-def test_collect_files_with_individual_files(tmp_path):
+def test_collect_files_with_individual_files(pdf_tree):
     """Test that collect_files handles individual file paths correctly."""
 
-    # Create test files
-    file1 = tmp_path / 'doc1.pdf'
-    file2 = tmp_path / 'doc2.pdf'
-    file1.write_text('test')
-    file2.write_text('test')
+    file1 = pdf_tree / 'doc1.pdf'
+    file2 = pdf_tree / 'level1' / 'doc2.pdf'
 
     files = collect_files([str(file1), str(file2)])
 
@@ -326,16 +286,11 @@ def test_collect_files_with_individual_files(tmp_path):
     assert file_names == {'doc1.pdf', 'doc2.pdf'}
 
 
-def test_collect_files_mixed_files_and_folders(tmp_path):
+def test_collect_files_mixed_files_and_folders(pdf_tree):
     """Test that collect_files handles a mix of files and folders."""
 
-    # Create test structure
-    file1 = tmp_path / 'doc1.pdf'
-    file1.write_text('test')
-
-    folder = tmp_path / 'subdir'
-    folder.mkdir()
-    (folder / 'doc2.pdf').write_text('test')
+    file1 = pdf_tree / 'doc1.pdf'
+    folder = pdf_tree / 'level1'
 
     files = collect_files([str(file1), str(folder)], recursive=False)
 
@@ -345,104 +300,86 @@ def test_collect_files_mixed_files_and_folders(tmp_path):
     assert file_names == {'doc1.pdf', 'doc2.pdf'}
 
 
-def test_parse_command_with_show_flag(runner, mock_document, tmp_path):
+def test_parse_command_with_show_flag(runner, mock_document, pdf_file, mock_parxy):
     """Test that the --show flag displays content in console."""
 
-    # Create a test PDF file
-    test_file = tmp_path / 'test.pdf'
-    test_file.write_text('dummy pdf content')
-
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.default_driver.return_value = 'pymupdf'
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file),
-                    driver='pymupdf',
-                    document=mock_document,
-                    error=None,
-                )
-            ]
-        )
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(pdf_file),
+                driver='pymupdf',
+                document=mock_document,
+                error=None,
+            )
+        ]
+    )
 
-        # Run command with --show flag
-        result = runner.invoke(app, [str(test_file), '--mode', 'plain', '--show'])
+    # Run command with --show flag
+    result = runner.invoke(app, [str(pdf_file), '--mode', 'plain', '--show'])
 
-        assert result.exit_code == 0
+    assert result.exit_code == 0
 
 
-def test_parse_command_with_stop_on_failure(runner, mock_document, tmp_path):
+def test_parse_command_with_stop_on_failure(
+    runner, mock_document, make_pdf_files, mock_parxy
+):
     """Test that --stop-on-failure stops processing on first error."""
 
-    # Create two test PDF files
-    test_file1 = tmp_path / 'test1.pdf'
-    test_file2 = tmp_path / 'test2.pdf'
-    test_file1.write_text('dummy pdf content')
-    test_file2.write_text('dummy pdf content')
-
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.default_driver.return_value = 'pymupdf'
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file1),
-                    driver='pymupdf',
-                    document=None,
-                    error='Test error',
-                ),
-                BatchResult(
-                    file=str(test_file2),
-                    driver='pymupdf',
-                    document=mock_document,
-                    error=None,
-                ),
-            ]
-        )
-
-        # Run command with --stop-on-failure
-        result = runner.invoke(
-            app, [str(test_file1), str(test_file2), '--stop-on-failure']
-        )
-
-        # Should exit with error code
-        assert result.exit_code == 1
-        # Should contain error message
-        assert 'error' in result.stdout.lower()
-        assert 'stopping due to error' in result.stdout.lower()
+    test_file1, test_file2 = make_pdf_files('test1.pdf', 'test2.pdf')
+
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(test_file1),
+                driver='pymupdf',
+                document=None,
+                error='Test error',
+            ),
+            BatchResult(
+                file=str(test_file2),
+                driver='pymupdf',
+                document=mock_document,
+                error=None,
+            ),
+        ]
+    )
+
+    # Run command with --stop-on-failure
+    result = runner.invoke(app, [str(test_file1), str(test_file2), '--stop-on-failure'])
+
+    # Should exit with error code
+    assert result.exit_code == 1
+    # Should contain error message
+    assert 'error' in result.stdout.lower()
+    assert 'stopping due to error' in result.stdout.lower()
 
 
 def test_parse_command_without_stop_on_failure_continues(
-    runner, mock_document, tmp_path
+    runner, mock_document, make_pdf_files, mock_parxy
 ):
     """Test that without --stop-on-failure, processing continues after errors."""
 
-    # Create two test PDF files
-    test_file1 = tmp_path / 'test1.pdf'
-    test_file2 = tmp_path / 'test2.pdf'
-    test_file1.write_text('dummy pdf content')
-    test_file2.write_text('dummy pdf content')
-
-    with patch('parxy_cli.commands.parse.Parxy') as mock_parxy:
-        mock_parxy.default_driver.return_value = 'pymupdf'
-        mock_parxy.batch_iter.return_value = iter(
-            [
-                BatchResult(
-                    file=str(test_file1),
-                    driver='pymupdf',
-                    document=None,
-                    error='Test error',
-                ),
-                BatchResult(
-                    file=str(test_file2),
-                    driver='pymupdf',
-                    document=mock_document,
-                    error=None,
-                ),
-            ]
-        )
-
-        # Run command without --stop-on-failure
-        result = runner.invoke(app, [str(test_file1), str(test_file2)])
-
-        # Should complete processing both files
-        assert 'error' in result.stdout.lower()
+    test_file1, test_file2 = make_pdf_files('test1.pdf', 'test2.pdf')
+
+    mock_parxy.results = iter(
+        [
+            BatchResult(
+                file=str(test_file1),
+                driver='pymupdf',
+                document=None,
+                error='Test error',
+            ),
+            BatchResult(
+                file=str(test_file2),
+                driver='pymupdf',
+                document=mock_document,
+                error=None,
+            ),
+        ]
+    )
+
+    # Run command without --stop-on-failure
+    result = runner.invoke(app, [str(test_file1), str(test_file2)])
+
+    # Should complete processing both files
+    assert 'error' in result.stdout.lower()
@@ -1,72 +1,90 @@
 """Test suite for PDF commands."""
 
+import shutil
+
 import pytest
 from pathlib import Path
-from typer.testing import CliRunner
 import pymupdf
 
 from parxy_cli.commands.pdf import app
 from parxy_cli.services import parse_input_with_pages, collect_pdf_files_with_ranges
 
 
-@pytest.fixture
-def runner():
-    """Fixture providing a CLI runner."""
-    return CliRunner()
+def render_pdf(pages, label):
+    """
+    Render a PDF with one line of text on each page.
+
+    Args:
+        pages: Number of pages
+        label: Text identifying the document on its pages
+
+    Returns:
+        The PDF content as bytes
+    """
+    pdf = pymupdf.open()
+    for i in range(pages):
+        page = pdf.new_page(width=612, height=792)
+        page.insert_text((100, 100), f'Page {i + 1} of {label}')
+    content = pdf.tobytes()
+    pdf.close()
+
+    return content
+
+
+def page_count(path):
+    """
+    Count the pages of a PDF file.
+
+    Args:
+        path: Path to the PDF file
+
+    Returns:
+        The number of pages
+    """
+    with pymupdf.open(path) as pdf:
+        return len(pdf)
+
+
+@pytest.fixture(scope='session')
+def _sample_pdf_files(tmp_path_factory):
+    """Create the sample PDF files once per session."""
+    base = tmp_path_factory.mktemp('sample_pdfs')
+
+    files = {}
+
+    # doc1 with 3 pages, doc2 with 2 pages and doc3 with 5 pages
+    for key, name, pages in [
+        ('pdf1', 'doc1', 3),
+        ('pdf2', 'doc2', 2),
+        ('pdf3', 'doc3', 5),
+    ]:
+        pdf_path = base / f'{name}.pdf'
+        pdf_path.write_bytes(render_pdf(pages, name))
+        files[key] = pdf_path
+
+    return files
 
 
 @pytest.fixture
-def sample_pdfs(tmp_path):
-    """Create sample PDF files for testing."""
-    # Create first PDF with 3 pages
-    pdf1_path = tmp_path / 'doc1.pdf'
-    pdf1 = pymupdf.open()
-    for i in range(3):
-        page = pdf1.new_page(width=612, height=792)
-        page.insert_text((100, 100), f'Page {i + 1} of doc1')
-    pdf1.save(str(pdf1_path))
-    pdf1.close()
-
-    # Create second PDF with 2 pages
-    pdf2_path = tmp_path / 'doc2.pdf'
-    pdf2 = pymupdf.open()
-    for i in range(2):
-        page = pdf2.new_page(width=612, height=792)
-        page.insert_text((100, 100), f'Page {i + 1} of doc2')
-    pdf2.save(str(pdf2_path))
-    pdf2.close()
-
-    # Create third PDF with 5 pages
-    pdf3_path = tmp_path / 'doc3.pdf'
-    pdf3 = pymupdf.open()
-    for i in range(5):
-        page = pdf3.new_page(width=612, height=792)
-        page.insert_text((100, 100), f'Page {i + 1} of doc3')
-    pdf3.save(str(pdf3_path))
-    pdf3.close()
-
-    return {
-        'pdf1': pdf1_path,
-        'pdf2': pdf2_path,
-        'pdf3': pdf3_path,
-        'tmp_path': tmp_path,
+def sample_pdfs(tmp_path, _sample_pdf_files):
+    """Copy the sample PDF files into the test directory."""
+    # Commands write default outputs next to their inputs, each test gets copies
+    files = {
+        key: shutil.copyfile(source, tmp_path / source.name)
+        for key, source in _sample_pdf_files.items()
     }
 
+    return {**files, 'tmp_path': tmp_path}
 
-@pytest.fixture
-def pdf_folder(tmp_path):
-    """Create a folder with multiple PDFs."""
-    folder = tmp_path / 'pdfs'
-    folder.mkdir()
+
+@pytest.fixture(scope='session')
+def pdf_folder(tmp_path_factory):
+    """Create a folder with multiple PDFs, shared by tests that only read it."""
+    folder = tmp_path_factory.mktemp('pdfs')
 
     # Create three PDFs in the folder
     for i in range(1, 4):
-        pdf_path = folder / f'file{i}.pdf'
-        pdf = pymupdf.open()
-        page = pdf.new_page(width=612, height=792)
-        page.insert_text((100, 100), f'Content of file{i}')
-        pdf.save(str(pdf_path))
-        pdf.close()
+        (folder / f'file{i}.pdf').write_bytes(render_pdf(1, f'file{i}'))
 
     return folder
 
@@ -75,56 +93,30 @@ def pdf_folder(tmp_path):
 class TestParseInputWithPages:
     """Tests for the parse_input_with_pages helper function."""
 
-    def test_no_page_range(self):
-        """Test parsing input without page range."""
-        file_path, from_page, to_page = parse_input_with_pages('file.pdf')
-        assert file_path == 'file.pdf'
-        assert from_page is None
-        assert to_page is None
-
-    def test_single_page(self):
-        """Test parsing single page specification."""
-        file_path, from_page, to_page = parse_input_with_pages('file.pdf[3]')
-        assert file_path == 'file.pdf'
-        assert from_page == 2  # 0-based index
-        assert to_page == 2
-
-    def test_range_from_start(self):
-        """Test parsing range from start to specified page."""
-        file_path, from_page, to_page = parse_input_with_pages('file.pdf[:5]')
-        assert file_path == 'file.pdf'
-        assert from_page == 0
-        assert to_page == 4  # 0-based index
-
-    def test_range_to_end(self):
-        """Test parsing range from specified page to end."""
-        file_path, from_page, to_page = parse_input_with_pages('file.pdf[3:]')
-        assert file_path == 'file.pdf'
-        assert from_page == 2  # 0-based index
-        assert to_page is None
-
-    def test_range_both_bounds(self):
-        """Test parsing range with both start and end specified."""
-        file_path, from_page, to_page = parse_input_with_pages('file.pdf[2:5]')
-        assert file_path == 'file.pdf'
-        assert from_page == 1  # 0-based index
-        assert to_page == 4  # 0-based index
-
-    def test_path_with_spaces(self):
-        """Test parsing path with spaces."""
-        file_path, from_page, to_page = parse_input_with_pages(
-            'path with spaces/file.pdf[1:3]'
+    @pytest.mark.parametrize(
+        'input_str,expected_path,expected_from,expected_to',
+        [
+            # No page range
+            ('file.pdf', 'file.pdf', None, None),
+            # Single page, converted to 0-based index
+            ('file.pdf[3]', 'file.pdf', 2, 2),
+            # Range from start to specified page
+            ('file.pdf[:5]', 'file.pdf', 0, 4),
+            # Range from specified page to end
+            ('file.pdf[3:]', 'file.pdf', 2, None),
+            # Range with both bounds
+            ('file.pdf[2:5]', 'file.pdf', 1, 4),
+            # Path with spaces
+            ('path with spaces/file.pdf[1:3]', 'path with spaces/file.pdf', 0, 2),
+        ],
+    )
+    def test_parse_input(self, input_str, expected_path, expected_from, expected_to):
+        """Test splitting the file path from the optional page range."""
+        assert parse_input_with_pages(input_str) == (
+            expected_path,
+            expected_from,
+            expected_to,
         )
-        assert file_path == 'path with spaces/file.pdf'
-        assert from_page == 0
-        assert to_page == 2
-
-    def test_path_with_brackets_in_name(self):
-        """Test parsing path without page range but with brackets elsewhere."""
-        file_path, from_page, to_page = parse_input_with_pages('file.pdf')
-        assert file_path == 'file.pdf'
-        assert from_page is None
-        assert to_page is None
 
 
 # Tests for collect_pdf_files_with_ranges helper function
@@ -205,15 +197,29 @@ class TestCollectPdfFilesWithRanges:
 class TestMergeCommand:
     """Tests for the pdf:merge command."""
 
-    def test_merge_two_files_basic(self, runner, sample_pdfs):
-        """Test basic merge of two PDF files."""
+    @pytest.mark.parametrize(
+        'inputs,expected_pages',
+        [
+            # Two full files, 3 pages from pdf1 + 2 pages from pdf2
+            (['{pdf1}', '{pdf2}'], 5),
+            # Files are merged in the specified order
+            (['{pdf2}', '{pdf1}'], 5),
+            # First 2 pages from pdf1 + only first page from pdf2
+            (['{pdf1}[1:2]', '{pdf2}[1]'], 3),
+            # All pages of pdf1 + pages 2-4 of pdf3
+            (['{pdf1}', '{pdf3}[2:4]'], 6),
+            # Open-ended ranges, first 2 pages + from page 3 to end of pdf3
+            (['{pdf3}[:2]', '{pdf3}[3:]'], 5),
+        ],
+    )
+    def test_merge_page_count(self, runner, sample_pdfs, inputs, expected_pages):
+        """Test merging full files and page ranges into a single PDF."""
         output = sample_pdfs['tmp_path'] / 'merged.pdf'
         result = runner.invoke(
             app,
             [
                 'pdf:merge',
-                str(sample_pdfs['pdf1']),
-                str(sample_pdfs['pdf2']),
+                *[value.format(**sample_pdfs) for value in inputs],
                 '--output',
                 str(output),
             ],
@@ -223,31 +229,7 @@ class TestMergeCommand:
         assert output.exists()
 
         # Verify the merged PDF has correct number of pages
-        merged = pymupdf.open(str(output))
-        assert len(merged) == 5  # 3 pages from pdf1 + 2 pages from pdf2
-        merged.close()
-
-    def test_merge_with_page_ranges(self, runner, sample_pdfs):
-        """Test merging with specific page ranges."""
-        output = sample_pdfs['tmp_path'] / 'merged.pdf'
-        result = runner.invoke(
-            app,
-            [
-                'pdf:merge',
-                f'{sample_pdfs["pdf1"]}[1:2]',  # First 2 pages
-                f'{sample_pdfs["pdf2"]}[1]',  # Only first page
-                '--output',
-                str(output),
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert output.exists()
-
-        # Verify the merged PDF has correct number of pages
-        merged = pymupdf.open(str(output))
-        assert len(merged) == 3  # 2 pages from pdf1 + 1 page from pdf2
-        merged.close()
+        assert page_count(output) == expected_pages
 
     def test_merge_folder(self, runner, pdf_folder, tmp_path):
         """Test merging all PDFs in a folder."""
@@ -260,9 +242,7 @@ class TestMergeCommand:
         assert output.exists()
 
         # Verify the merged PDF has correct number of pages (3 PDFs with 1 page each)
-        merged = pymupdf.open(str(output))
-        assert len(merged) == 3
-        merged.close()
+        assert page_count(output) == 3
 
     def test_merge_without_output_prompts(self, runner, sample_pdfs):
         """Test that merge prompts for output when not specified."""
@@ -352,71 +332,6 @@ class TestMergeCommand:
         # Should show warning but continue with pdf2
         assert 'invalid page range' in result.stdout.lower() or result.exit_code == 0
 
-    def test_merge_mixed_files_and_ranges(self, runner, sample_pdfs):
-        """Test merging mix of full files and page ranges."""
-        output = sample_pdfs['tmp_path'] / 'merged.pdf'
-        result = runner.invoke(
-            app,
-            [
-                'pdf:merge',
-                str(sample_pdfs['pdf1']),  # All pages (3)
-                f'{sample_pdfs["pdf3"]}[2:4]',  # Pages 2-4 (3 pages)
-                '--output',
-                str(output),
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert output.exists()
-
-        merged = pymupdf.open(str(output))
-        assert len(merged) == 6  # 3 from pdf1 + 3 from pdf3[2:4]
-        merged.close()
-
-    def test_merge_with_open_ended_range(self, runner, sample_pdfs):
-        """Test merging with open-ended page ranges."""
-        output = sample_pdfs['tmp_path'] / 'merged.pdf'
-        result = runner.invoke(
-            app,
-            [
-                'pdf:merge',
-                f'{sample_pdfs["pdf3"]}[:2]',  # First 2 pages
-                f'{sample_pdfs["pdf3"]}[3:]',  # From page 3 to end (3 pages)
-                '--output',
-                str(output),
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert output.exists()
-
-        merged = pymupdf.open(str(output))
-        assert len(merged) == 5  # 2 + 3 pages
-        merged.close()
-
-    def test_merge_preserves_order(self, runner, sample_pdfs):
-        """Test that files are merged in the specified order."""
-        output = sample_pdfs['tmp_path'] / 'merged.pdf'
-        result = runner.invoke(
-            app,
-            [
-                'pdf:merge',
-                str(sample_pdfs['pdf2']),
-                str(sample_pdfs['pdf1']),
-                '--output',
-                str(output),
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert output.exists()
-
-        merged = pymupdf.open(str(output))
-        # Should be pdf2 pages first, then pdf1 pages
-        assert len(merged) == 5
-        # We can't easily verify order without reading content, but count is correct
-        merged.close()
-
     def test_merge_relative_output_path(self, runner, sample_pdfs):
         """Test that relative output path uses first file's directory."""
         result = runner.invoke(
@@ -467,9 +382,7 @@ class TestSplitCommand:
 
         # Verify each file has exactly 1 page
         for output_file in output_files:
-            pdf = pymupdf.open(str(output_file))
-            assert len(pdf) == 1
-            pdf.close()
+            assert page_count(output_file) == 1
 
     def test_split_with_custom_prefix(self, runner, sample_pdfs):
         """Test splitting with a custom filename prefix."""
@@ -542,15 +455,10 @@ class TestSplitCommand:
         assert result.exit_code == 1
         assert 'must be a pdf' in result.stdout.lower()
 
-    def test_split_single_page_pdf(self, runner, tmp_path):
+    def test_split_single_page_pdf(self, runner, pdf_folder, tmp_path):
         """Test splitting a single-page PDF."""
-        # Create a single-page PDF
-        pdf_path = tmp_path / 'single.pdf'
-        pdf = pymupdf.open()
-        page = pdf.new_page(width=612, height=792)
-        page.insert_text((100, 100), 'Single page')
-        pdf.save(str(pdf_path))
-        pdf.close()
+        # Copy a single-page PDF
+        pdf_path = shutil.copyfile(pdf_folder / 'file1.pdf', tmp_path / 'single.pdf')
 
         output_dir = tmp_path / 'split_single'
         result = runner.invoke(
@@ -682,9 +590,7 @@ class TestSplitCommand:
         assert result.exit_code == 0
         assert output.exists()
 
-        pdf = pymupdf.open(str(output))
-        assert len(pdf) == 2
-        pdf.close()
+        assert page_count(output) == 2
 
     def test_split_combine_default_output_name(self, runner, sample_pdfs):
         """Test --combine without --output uses auto-generated filename."""
@@ -703,9 +609,7 @@ class TestSplitCommand:
         expected = sample_pdfs['pdf1'].parent / 'doc1_pages_1-2.pdf'
         assert expected.exists()
 
-        pdf = pymupdf.open(str(expected))
-        assert len(pdf) == 2
-        pdf.close()
+        assert page_count(expected) == 2
 
     def test_split_combine_single_page(self, runner, sample_pdfs):
         """Test --combine with a single page produces a one-page PDF."""
@@ -724,9 +628,7 @@ class TestSplitCommand:
         expected = sample_pdfs['pdf1'].parent / 'doc1_pages_2.pdf'
         assert expected.exists()
 
-        pdf = pymupdf.open(str(expected))
-        assert len(pdf) == 1
-        pdf.close()
+        assert page_count(expected) == 1
 
     def test_split_combine_all_pages(self, runner, sample_pdfs):
         """Test --combine without --pages combines all pages."""
@@ -743,9 +645,7 @@ class TestSplitCommand:
         expected = sample_pdfs['pdf1'].parent / 'doc1_pages_1-3.pdf'
         assert expected.exists()
 
-        pdf = pymupdf.open(str(expected))
-        assert len(pdf) == 3
-        pdf.close()
+        assert page_count(expected) == 3
 
     def test_split_combine_does_not_create_split_directory(self, runner, sample_pdfs):
         """Test that --combine does not create an unwanted split directory."""
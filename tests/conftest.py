@@ -0,0 +1,13 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture(scope='session')
+def fixture_pdf_bytes():
+    """Content of the fixture PDF with an attachment, read once per session."""
+    return (FIXTURES_DIR / 'pdf-with-attachment.pdf').read_bytes()
@@ -0,0 +1,85 @@
+"""Shared fixtures for the console tests."""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+
+from parxy_cli.console.console import Console
+
+
+def capture_output(console):
+    """
+    Send the output of a console to an in-memory buffer.
+
+    Args:
+        console: Console whose underlying Rich console writes to the buffer
+
+    Returns:
+        The same console
+    """
+    console.console.file = io.StringIO()
+    return console
+
+
+def clear_output(console):
+    """
+    Empty the output buffer of a console built by capture_output.
+
+    Args:
+        console: Console to clear
+
+    Returns:
+        The same console
+    """
+    console.console.file.seek(0)
+    console.console.file.truncate(0)
+    return console
+
+
+@pytest.fixture(scope='module')
+def _dark_console():
+    """Build the dark themed console shared by the output tests of a module."""
+    return capture_output(Console(theme_mode='dark'))
+
+
+@pytest.fixture(scope='module')
+def _light_console():
+    """Build the light themed console shared by the output tests of a module."""
+    return capture_output(Console(theme_mode='light'))
+
+
+@pytest.fixture
+def dark_console(_dark_console):
+    """Fixture providing the shared dark themed console with an empty output buffer."""
+    return clear_output(_dark_console)
+
+
+@pytest.fixture
+def light_console(_light_console):
+    """Fixture providing the shared light themed console with an empty output buffer."""
+    return clear_output(_light_console)
+
+
+@pytest.fixture
+def mock_print(monkeypatch, dark_console):
+    """Fixture replacing print on the shared dark console with a mock."""
+    mock = Mock()
+    monkeypatch.setattr(dark_console.console, 'print', mock)
+    return mock
+
+
+@pytest.fixture
+def mock_rule(monkeypatch, dark_console):
+    """Fixture replacing rule on the shared dark console with a mock."""
+    mock = Mock()
+    monkeypatch.setattr(dark_console.console, 'rule', mock)
+    return mock
+
+
+@pytest.fixture
+def mock_clear(monkeypatch, dark_console):
+    """Fixture replacing clear on the shared dark console with a mock."""
+    mock = Mock()
+    monkeypatch.setattr(dark_console.console, 'clear', mock)
+    return mock
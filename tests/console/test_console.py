@@ -18,43 +18,60 @@ from unittest.mock import Mock, patch, MagicMock, call
 import pytest
 from rich.console import Console as RichConsole
 from rich.live import Live
+from rich.progress import Progress
+from rich.table import Table
+from rich.text import Text
 
 from parxy_cli.console.console import Console, COLORS_DARK, COLORS_LIGHT, Shimmer
 from parxy_core.models.config import ParxyConfig
 
 
+@pytest.fixture(scope='module')
+def dark_config():
+    """Fixture providing a read-only configuration with the dark theme."""
+    return ParxyConfig(theme='dark')
+
+
+@pytest.fixture(scope='module')
+def light_config():
+    """Fixture providing a read-only configuration with the light theme."""
+    return ParxyConfig(theme='light')
+
+
+@pytest.fixture(scope='module')
+def mock_console():
+    """Fixture providing the console passed to Shimmer, which never inspects it."""
+    return Mock()
+
+
+@pytest.fixture(scope='module')
+def mock_options():
+    """Fixture providing the render options passed to Shimmer, which never inspects them."""
+    return Mock()
+
+
 class TestConsoleThemeDetection:
     """Tests for terminal background detection and theme selection."""
 
-    def test_detect_terminal_background_from_config_dark(self):
+    def test_detect_terminal_background_from_config_dark(self, dark_config):
         """Test theme detection from ParxyConfig - dark theme."""
-        config = ParxyConfig(theme='dark')
-        theme = Console.detect_terminal_background(config)
+        theme = Console.detect_terminal_background(dark_config)
         assert theme == 'dark'
 
-    def test_detect_terminal_background_from_config_light(self):
+    def test_detect_terminal_background_from_config_light(self, light_config):
         """Test theme detection from ParxyConfig - light theme."""
-        config = ParxyConfig(theme='light')
-        theme = Console.detect_terminal_background(config)
+        theme = Console.detect_terminal_background(light_config)
         assert theme == 'light'
 
-    @patch.dict(os.environ, {'COLORFGBG': '15;0'})
-    def test_detect_terminal_background_from_colorfgbg_dark(self):
-        """Test theme detection from COLORFGBG environment variable - dark."""
-        theme = Console.detect_terminal_background()
-        assert theme == 'dark'
-
-    @patch.dict(os.environ, {'COLORFGBG': '0;7'})
-    def test_detect_terminal_background_from_colorfgbg_light(self):
-        """Test theme detection from COLORFGBG environment variable - light."""
-        theme = Console.detect_terminal_background()
-        assert theme == 'light'
-
-    @patch.dict(os.environ, {'COLORFGBG': '0;15'})
-    def test_detect_terminal_background_from_colorfgbg_light_15(self):
-        """Test theme detection from COLORFGBG with background color 15."""
-        theme = Console.detect_terminal_background()
-        assert theme == 'light'
+    @pytest.mark.parametrize(
+        'colorfgbg,expected',
+        [('15;0', 'dark'), ('0;7', 'light'), ('0;15', 'light')],
+    )
+    def test_detect_terminal_background_from_colorfgbg(self, colorfgbg, expected):
+        """Test theme detection from COLORFGBG environment variable."""
+        with patch.dict(os.environ, {'COLORFGBG': colorfgbg}):
+            theme = Console.detect_terminal_background()
+        assert theme == expected
 
     @patch.dict(os.environ, {}, clear=True)
     def test_detect_terminal_background_default_dark(self):
@@ -62,11 +79,10 @@ class TestConsoleThemeDetection:
         theme = Console.detect_terminal_background()
         assert theme == 'dark'
 
-    def test_detect_terminal_background_config_overrides_env(self):
+    def test_detect_terminal_background_config_overrides_env(self, dark_config):
         """Test that config theme takes precedence over environment variables."""
         with patch.dict(os.environ, {'COLORFGBG': '0;7'}):
-            config = ParxyConfig(theme='dark')
-            theme = Console.detect_terminal_background(config)
+            theme = Console.detect_terminal_background(dark_config)
             assert theme == 'dark'
 
 
@@ -82,32 +98,26 @@ class TestConsoleInitialization:
         assert console.console is not None
         assert isinstance(console.console, RichConsole)
 
-    def test_console_initialization_light_theme(self):
+    def test_console_initialization_light_theme(self, light_console):
         """Test console initializes with light theme."""
-        console = Console(theme_mode='light')
-        assert console.theme_mode == 'light'
-        assert console.COLORS == COLORS_LIGHT
+        assert light_console.theme_mode == 'light'
+        assert light_console.COLORS == COLORS_LIGHT
 
-    def test_console_initialization_dark_theme(self):
+    def test_console_initialization_dark_theme(self, dark_console):
         """Test console initializes with dark theme explicitly."""
-        console = Console(theme_mode='dark')
-        assert console.theme_mode == 'dark'
-        assert console.COLORS == COLORS_DARK
+        assert dark_console.theme_mode == 'dark'
+        assert dark_console.COLORS == COLORS_DARK
 
-    def test_console_initialization_with_config(self):
+    def test_console_initialization_with_config(self, light_config):
         """Test console initializes with config object."""
-        config = ParxyConfig(theme='light')
-        console = Console(config=config)
+        console = Console(config=light_config)
         assert console.theme_mode == 'light'
         assert console.COLORS == COLORS_LIGHT
 
-    def test_get_theme_mode(self):
+    def test_get_theme_mode(self, dark_console, light_console):
         """Test get_theme_mode returns correct theme."""
-        console_dark = Console(theme_mode='dark')
-        console_light = Console(theme_mode='light')
-
-        assert console_dark.get_theme_mode() == 'dark'
-        assert console_light.get_theme_mode() == 'light'
+        assert dark_console.get_theme_mode() == 'dark'
+        assert light_console.get_theme_mode() == 'light'
 
     def test_console_theme_has_all_required_styles(self):
         """Test that console theme includes all required style definitions."""
@@ -133,118 +143,69 @@ class TestConsoleInitialization:
 class TestConsoleBasicOutput:
     """Tests for basic console output methods."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_print_method(self, mock_print):
+    def test_print_method(self, dark_console, mock_print):
         """Test basic print method."""
-        console = Console()
-        console.print('Test message')
+        dark_console.print('Test message')
 
         mock_print.assert_called_once()
         args = mock_print.call_args[0]
         assert 'Test message' in args
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_print_with_style(self, mock_print):
+    def test_print_with_style(self, dark_console, mock_print):
         """Test print method with style parameter."""
-        console = Console()
-        console.print('Test message', style='bold')
+        dark_console.print('Test message', style='bold')
 
-        mock_print.assert_called_once()
-        assert mock_print.call_args[1]['style'] == 'bold'
+        mock_print.assert_called_once_with('Test message', style='bold')
 
 
 class TestConsoleMessageTypes:
     """Tests for styled message output methods."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_success_message(self, mock_print):
-        """Test success message output."""
-        console = Console()
-        console.success('Operation successful')
+    @pytest.mark.parametrize(
+        'method,message',
+        [
+            ('success', 'Operation successful'),
+            ('info', 'Information message'),
+            ('warning', 'Warning message'),
+            ('error', 'Error message'),
+        ],
+    )
+    def test_message_types(self, dark_console, mock_print, method, message):
+        """Test success, info, warning and error message output."""
+        getattr(dark_console, method)(message)
 
         mock_print.assert_called_once()
         # Verify a Table object was printed (from _icon_and_text)
-        from rich.table import Table
-
         printed_obj = mock_print.call_args[0][0]
         assert isinstance(printed_obj, Table)
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_success_message_custom_prefix(self, mock_print):
+    def test_success_message_custom_prefix(self, dark_console, mock_print):
         """Test success message with custom prefix."""
-        console = Console()
-        console.success('Done', prefix='✔')
+        dark_console.success('Done', prefix='✔')
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_success_message_with_panel(self, mock_print):
+    def test_success_message_with_panel(self, dark_console, mock_print):
         """Test success message with panel."""
-        console = Console()
-        console.success('Success in panel', panel=True)
+        dark_console.success('Success in panel', panel=True)
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_info_message(self, mock_print):
-        """Test info message output."""
-        console = Console()
-        console.info('Information message')
-
-        mock_print.assert_called_once()
-        # Verify a Table object was printed (from _icon_and_text)
-        from rich.table import Table
-
-        printed_obj = mock_print.call_args[0][0]
-        assert isinstance(printed_obj, Table)
-
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_info_message_with_panel(self, mock_print):
+    def test_info_message_with_panel(self, dark_console, mock_print):
         """Test info message with panel."""
-        console = Console()
-        console.info('Info in panel', panel=True)
+        dark_console.info('Info in panel', panel=True)
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_warning_message(self, mock_print):
-        """Test warning message output."""
-        console = Console()
-        console.warning('Warning message')
-
-        mock_print.assert_called_once()
-        # Verify a Table object was printed (from _icon_and_text)
-        from rich.table import Table
-
-        printed_obj = mock_print.call_args[0][0]
-        assert isinstance(printed_obj, Table)
-
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_warning_message_with_panel(self, mock_print):
+    def test_warning_message_with_panel(self, dark_console, mock_print):
         """Test warning message with panel."""
-        console = Console()
-        console.warning('Warning in panel', panel=True)
+        dark_console.warning('Warning in panel', panel=True)
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_error_message(self, mock_print):
-        """Test error message output."""
-        console = Console()
-        console.error('Error message')
-
-        mock_print.assert_called_once()
-        # Verify a Table object was printed (from _icon_and_text)
-        from rich.table import Table
-
-        printed_obj = mock_print.call_args[0][0]
-        assert isinstance(printed_obj, Table)
-
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_error_message_with_panel(self, mock_print):
+    def test_error_message_with_panel(self, dark_console, mock_print):
         """Test error message with panel."""
-        console = Console()
-        console.error('Error in panel', panel=True)
+        dark_console.error('Error in panel', panel=True)
 
         mock_print.assert_called_once()
 
@@ -252,65 +213,46 @@ class TestConsoleMessageTypes:
 class TestConsoleTextStyles:
     """Tests for text styling methods."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_muted_text(self, mock_print):
+    def test_muted_text(self, dark_console, mock_print):
         """Test muted text output."""
-        console = Console()
-        console.muted('Muted message')
+        dark_console.muted('Muted message')
 
-        mock_print.assert_called_once()
-        assert mock_print.call_args[0][0] == 'Muted message'
-        assert mock_print.call_args[1]['style'] == 'muted'
+        mock_print.assert_called_once_with('Muted message', style='muted')
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_faint_text(self, mock_print):
+    def test_faint_text(self, dark_console, mock_print):
         """Test faint text output."""
-        console = Console()
-        console.faint('Faint message')
+        dark_console.faint('Faint message')
 
-        mock_print.assert_called_once()
-        assert mock_print.call_args[0][0] == 'Faint message'
-        assert mock_print.call_args[1]['style'] == 'faint'
+        mock_print.assert_called_once_with('Faint message', style='faint')
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_highlight_text(self, mock_print):
+    def test_highlight_text(self, dark_console, mock_print):
         """Test highlighted text output."""
-        console = Console()
-        console.highlight('Highlighted message')
+        dark_console.highlight('Highlighted message')
 
-        mock_print.assert_called_once()
-        assert mock_print.call_args[0][0] == 'Highlighted message'
-        assert mock_print.call_args[1]['style'] == 'highlight'
+        mock_print.assert_called_once_with('Highlighted message', style='highlight')
 
 
 class TestConsoleSpecialMethods:
     """Tests for special console methods."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_parxy_method(self, mock_print):
+    def test_parxy_method(self, dark_console, mock_print):
         """Test Parxy branding output."""
-        console = Console()
-        console.parxy()
+        dark_console.parxy()
 
         # Should print twice (title and tagline) plus newline
         assert mock_print.call_count >= 2
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_action_method(self, mock_print):
+    def test_action_method(self, dark_console, mock_print):
         """Test action output."""
-        console = Console()
-        console.action('Performing action')
+        dark_console.action('Performing action')
 
         # Should print the action and a newline
         assert mock_print.call_count >= 1
-        call_args = str(mock_print.call_args_list)
-        assert 'Performing action' in call_args
+        assert any('Performing action' in c.args[0] for c in mock_print.call_args_list)
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_action_method_with_space_before(self, mock_print):
+    def test_action_method_with_space_before(self, dark_console, mock_print):
         """Test action output with space before."""
-        console = Console()
-        console.action('Action with space', space_before=True)
+        dark_console.action('Action with space', space_before=True)
 
         # Should print newline, action, and another newline
         assert mock_print.call_count >= 2
@@ -319,21 +261,17 @@ class TestConsoleSpecialMethods:
 class TestConsoleMarkdown:
     """Tests for markdown rendering."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_markdown_rendering(self, mock_print):
+    def test_markdown_rendering(self, dark_console, mock_print):
         """Test markdown content rendering."""
-        console = Console()
         markdown_content = '# Heading\n\nThis is **bold** text.'
-        console.markdown(markdown_content)
+        dark_console.markdown(markdown_content)
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_markdown_with_custom_code_theme(self, mock_print):
+    def test_markdown_with_custom_code_theme(self, dark_console, mock_print):
         """Test markdown with custom code theme."""
-        console = Console()
         markdown_content = '```python\nprint("Hello")\n```'
-        console.markdown(markdown_content, code_theme='github-dark')
+        dark_console.markdown(markdown_content, code_theme='github-dark')
 
         mock_print.assert_called_once()
 
@@ -341,51 +279,39 @@ class TestConsoleMarkdown:
 class TestConsolePanelsAndQuotes:
     """Tests for panels and quote rendering."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_panel_basic(self, mock_print):
+    def test_panel_basic(self, dark_console, mock_print):
         """Test basic panel output."""
-        console = Console()
-        console.panel('Panel content')
+        dark_console.panel('Panel content')
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_panel_with_title(self, mock_print):
+    def test_panel_with_title(self, dark_console, mock_print):
         """Test panel with title."""
-        console = Console()
-        console.panel('Panel content', title='Panel Title')
+        dark_console.panel('Panel content', title='Panel Title')
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_panel_with_border_style(self, mock_print):
+    def test_panel_with_border_style(self, dark_console, mock_print):
         """Test panel with custom border style."""
-        console = Console()
-        console.panel('Panel content', border_style='red')
+        dark_console.panel('Panel content', border_style='red')
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_quote_single_line(self, mock_print):
+    def test_quote_single_line(self, dark_console, mock_print):
         """Test quote with single line."""
-        console = Console()
-        console.quote('This is a quote')
+        dark_console.quote('This is a quote')
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_quote_multiline(self, mock_print):
+    def test_quote_multiline(self, dark_console, mock_print):
         """Test quote with multiple lines."""
-        console = Console()
-        console.quote('Line 1\nLine 2\nLine 3')
+        dark_console.quote('Line 1\nLine 2\nLine 3')
 
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_quote_with_expand(self, mock_print):
+    def test_quote_with_expand(self, dark_console, mock_print):
         """Test quote with expand parameter."""
-        console = Console()
-        console.quote('Expanded quote', expand=True)
+        dark_console.quote('Expanded quote', expand=True)
 
         mock_print.assert_called_once()
 
@@ -393,29 +319,23 @@ class TestConsolePanelsAndQuotes:
 class TestConsoleSeparator:
     """Tests for separator/rule rendering."""
 
-    @patch('parxy_cli.console.console.RichConsole.rule')
-    def test_separator_basic(self, mock_rule):
+    def test_separator_basic(self, dark_console, mock_rule):
         """Test basic separator."""
-        console = Console()
-        console.separator()
+        dark_console.separator()
 
         mock_rule.assert_called_once()
         assert mock_rule.call_args[1]['align'] == 'left'
 
-    @patch('parxy_cli.console.console.RichConsole.rule')
-    def test_separator_with_title(self, mock_rule):
+    def test_separator_with_title(self, dark_console, mock_rule):
         """Test separator with title."""
-        console = Console()
-        console.separator('Section Title')
+        dark_console.separator('Section Title')
 
         mock_rule.assert_called_once()
         assert mock_rule.call_args[0][0] == 'Section Title'
 
-    @patch('parxy_cli.console.console.RichConsole.rule')
-    def test_separator_with_style(self, mock_rule):
+    def test_separator_with_style(self, dark_console, mock_rule):
         """Test separator with custom style."""
-        console = Console()
-        console.separator(style='red')
+        dark_console.separator(style='red')
 
         mock_rule.assert_called_once()
 
@@ -423,82 +343,78 @@ class TestConsoleSeparator:
 class TestConsoleContextManagers:
     """Tests for context manager methods (progress, spinner, shimmer)."""
 
-    def test_progress_context_manager(self):
+    @patch('rich.progress.Progress.stop')
+    @patch('rich.progress.Progress.start')
+    def test_progress_context_manager(self, mock_start, mock_stop, dark_console):
         """Test progress context manager."""
-        console = Console()
-
-        with console.progress('Processing') as progress:
+        # Starting and stopping are stubbed, no live display is refreshed
+        with dark_console.progress('Processing') as progress:
             assert progress is not None
             # Progress should be a Progress instance from rich
-            from rich.progress import Progress
-
             assert isinstance(progress, Progress)
 
+        mock_start.assert_called_once()
+        mock_stop.assert_called_once()
+
     @patch('parxy_cli.console.console.RichConsole.status')
-    def test_spinner_context_manager(self, mock_status):
+    def test_spinner_context_manager(self, mock_status, dark_console):
         """Test spinner context manager."""
         mock_context = MagicMock()
         mock_status.return_value.__enter__ = Mock(return_value=mock_context)
         mock_status.return_value.__exit__ = Mock(return_value=False)
 
-        console = Console()
-
-        with console.spinner('Loading data'):
+        with dark_console.spinner('Loading data'):
             pass
 
         mock_status.assert_called_once()
-        call_args = mock_status.call_args
-        assert 'Loading data' in str(call_args)
+        assert 'Loading data' in mock_status.call_args.args[0]
 
-    def test_shimmer_context_manager(self):
+    @patch('parxy_cli.console.console.Live')
+    def test_shimmer_context_manager(self, mock_live, dark_console):
         """Test shimmer context manager."""
-        console = Console()
-
         # Test that shimmer context manager works
-        with console.shimmer('Processing data', speed=2.0):
+        with dark_console.shimmer('Processing data', speed=2.0):
             pass  # Should not raise any exceptions
 
-    def test_shimmer_context_manager_clears_on_exit(self):
-        """Test that shimmer clears output when context exits."""
-        console = Console()
+        # The Live display is stubbed, only the renderable it receives is checked
+        shimmer = mock_live.call_args[0][0]
+        assert isinstance(shimmer, Shimmer)
+        assert shimmer.text == 'Processing data'
+        assert shimmer.speed == 2.0
 
-        with patch.object(console.console, 'print') as mock_print:
-            with console.shimmer('Test shimmer'):
-                pass
+    @patch('parxy_cli.console.console.Live')
+    def test_shimmer_context_manager_clears_on_exit(self, mock_live, dark_console):
+        """Test that shimmer clears output when context exits."""
+        with dark_console.shimmer('Test shimmer'):
+            pass
 
         # Shimmer uses Live with transient=True, so no explicit clear needed
+        assert mock_live.call_args[1]['transient'] is True
+        mock_live.return_value.__exit__.assert_called_once()
 
 
 class TestConsoleUtilityMethods:
     """Tests for utility methods."""
 
-    @patch('parxy_cli.console.console.RichConsole.clear')
-    def test_clear_method(self, mock_clear):
+    def test_clear_method(self, dark_console, mock_clear):
         """Test clear console method."""
-        console = Console()
-        console.clear()
+        dark_console.clear()
 
         mock_clear.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_newline_default(self, mock_print):
+    def test_newline_default(self, dark_console, mock_print):
         """Test newline with default count."""
-        console = Console()
-        console.newline()
+        dark_console.newline()
 
-        mock_print.assert_called_once()
         # Default should print empty string (one newline)
-        assert mock_print.call_args[0][0] == ''
+        mock_print.assert_called_once_with('')
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_newline_multiple(self, mock_print):
+    def test_newline_multiple(self, dark_console, mock_print):
         """Test newline with multiple lines."""
-        console = Console()
-        console.newline(3)
+        dark_console.newline(3)
 
-        mock_print.assert_called_once()
         # Should print two newlines (count-1)
-        assert mock_print.call_args[0][0] == '\n\n'
+        mock_print.assert_called_once_with('\n\n')
 
 
 class TestShimmerClass:
@@ -522,26 +438,20 @@ class TestShimmerClass:
         assert shimmer.position == 0
         assert shimmer.direction == 1
 
-    def test_shimmer_render(self):
+    def test_shimmer_render(self, mock_console, mock_options):
         """Test Shimmer rendering."""
         shimmer = Shimmer(
             text='Test', normal_color='white', dim_color='gray', mid_color='lightgray'
         )
 
-        # Create a mock console and options
-        mock_console = Mock()
-        mock_options = Mock()
-
         # Get the rendered output
         result = list(shimmer.__rich_console__(mock_console, mock_options))
 
         # Should return a Text object
         assert len(result) == 1
-        from rich.text import Text
-
         assert isinstance(result[0], Text)
 
-    def test_shimmer_animation_advances(self):
+    def test_shimmer_animation_advances(self, mock_console, mock_options):
         """Test that shimmer animation advances position."""
         shimmer = Shimmer(
             text='Testing',
@@ -551,40 +461,34 @@ class TestShimmerClass:
             speed=1.0,
         )
 
-        initial_position = shimmer.position
-
-        # Render multiple times to advance animation
-        mock_console = Mock()
-        mock_options = Mock()
+        # Each render advances the animation, a single one is enough
+        list(shimmer.__rich_console__(mock_console, mock_options))
 
-        for _ in range(5):
-            list(shimmer.__rich_console__(mock_console, mock_options))
+        assert shimmer._frame_count == 1
+        assert shimmer.position == 1
 
-        # Position should have changed (unless we hit a boundary and bounced)
-        assert shimmer._frame_count > 0
-
-    def test_shimmer_bounces_at_edges(self):
+    def test_shimmer_bounces_at_edges(self, mock_console, mock_options):
         """Test that shimmer bounces at text edges."""
         shimmer = Shimmer(
-            text='Hi',
+            text='Testing',
             normal_color='white',
             dim_color='gray',
             mid_color='lightgray',
             speed=1.0,
         )
 
-        mock_console = Mock()
-        mock_options = Mock()
+        # Start one step before the last character
+        shimmer.position = len(shimmer.text) - 2
+        shimmer.direction = 1
 
-        # Render enough times to hit the edge
-        for _ in range(10):
-            list(shimmer.__rich_console__(mock_console, mock_options))
+        list(shimmer.__rich_console__(mock_console, mock_options))
 
-        # Direction should have changed at some point
+        # Direction should have reversed at the edge
         # Position should be within bounds
+        assert shimmer.direction == -1
         assert 0 <= shimmer.position < len(shimmer.text)
 
-    def test_shimmer_measure(self):
+    def test_shimmer_measure(self, mock_console, mock_options):
         """Test shimmer measurement for layout."""
         shimmer = Shimmer(
             text='Test text',
@@ -593,9 +497,6 @@ class TestShimmerClass:
             mid_color='lightgray',
         )
 
-        mock_console = Mock()
-        mock_options = Mock()
-
         measurement = shimmer.__rich_measure__(mock_console, mock_options)
 
         # Should return measurement matching text length
@@ -606,74 +507,57 @@ class TestShimmerClass:
 class TestConsoleIntegration:
     """Integration tests for console methods working together."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_multiple_message_types_in_sequence(self, mock_print):
+    def test_multiple_message_types_in_sequence(self, dark_console, mock_print):
         """Test outputting multiple message types."""
-        console = Console()
-
-        console.success('Success message')
-        console.info('Info message')
-        console.warning('Warning message')
-        console.error('Error message')
+        dark_console.success('Success message')
+        dark_console.info('Info message')
+        dark_console.warning('Warning message')
+        dark_console.error('Error message')
 
         assert mock_print.call_count == 4
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_mixed_output_methods(self, mock_print):
+    def test_mixed_output_methods(self, dark_console, mock_print):
         """Test mixing different output methods."""
-        console = Console()
-
-        console.print('Regular print')
-        console.muted('Muted text')
-        console.panel('Panel content')
-        console.markdown('# Markdown')
+        dark_console.print('Regular print')
+        dark_console.muted('Muted text')
+        dark_console.panel('Panel content')
+        dark_console.markdown('# Markdown')
 
         assert mock_print.call_count == 4
 
-    def test_theme_consistency_across_methods(self):
+    def test_theme_consistency_across_methods(self, dark_console, light_console):
         """Test that theme is consistently applied."""
-        console_dark = Console(theme_mode='dark')
-        console_light = Console(theme_mode='light')
-
         # Both should have consistent color schemes
-        assert console_dark.COLORS == COLORS_DARK
-        assert console_light.COLORS == COLORS_LIGHT
+        assert dark_console.COLORS == COLORS_DARK
+        assert light_console.COLORS == COLORS_LIGHT
 
         # Theme should be reflected in internal console
-        assert console_dark.theme_mode == 'dark'
-        assert console_light.theme_mode == 'light'
+        assert dark_console.theme_mode == 'dark'
+        assert light_console.theme_mode == 'light'
 
 
 class TestConsoleEdgeCases:
     """Tests for edge cases and error conditions."""
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_empty_message_success(self, mock_print):
+    def test_empty_message_success(self, dark_console, mock_print):
         """Test success with empty message."""
-        console = Console()
-        console.success('')
+        dark_console.success('')
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_very_long_message(self, mock_print):
+    def test_very_long_message(self, dark_console, mock_print):
         """Test with very long message."""
-        console = Console()
         long_message = 'A' * 1000
-        console.info(long_message)
+        dark_console.info(long_message)
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_message_with_special_characters(self, mock_print):
+    def test_message_with_special_characters(self, dark_console, mock_print):
         """Test message with special characters."""
-        console = Console()
-        console.print('Message with émojis 🎉 and spëcial çharacters')
+        dark_console.print('Message with émojis 🎉 and spëcial çharacters')
         mock_print.assert_called_once()
 
-    @patch('parxy_cli.console.console.RichConsole.print')
-    def test_multiline_message(self, mock_print):
+    def test_multiline_message(self, dark_console, mock_print):
         """Test multiline message handling."""
-        console = Console()
-        console.success('Line 1\nLine 2\nLine 3')
+        dark_console.success('Line 1\nLine 2\nLine 3')
         mock_print.assert_called_once()
 
     def test_shimmer_with_empty_text(self):
@@ -685,15 +569,12 @@ class TestConsoleEdgeCases:
         assert shimmer.text == ''
         assert shimmer.position == 0
 
-    def test_shimmer_with_single_character(self):
+    def test_shimmer_with_single_character(self, mock_console, mock_options):
         """Test shimmer with single character."""
         shimmer = Shimmer(
             text='A', normal_color='white', dim_color='gray', mid_color='lightgray'
         )
 
-        mock_console = Mock()
-        mock_options = Mock()
-
         result = list(shimmer.__rich_console__(mock_console, mock_options))
         assert len(result) == 1
 
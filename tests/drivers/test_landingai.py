@@ -1,6 +1,7 @@
 import os
 import pytest
 import re
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
 from parxy_core.exceptions import (
@@ -16,41 +17,57 @@ from parxy_core.drivers import LandingAIADEDriver
 from parxy_core.models import LandingAIConfig
 
 
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures'
+)
+
+# HTML tags, used to strip the anchors LandingAI adds to the page text
+ANCHOR_PATTERN = re.compile(r'<[^>]+>')
+
+
+@pytest.fixture(scope='module')
+def driver():
+    """Fixture providing a LandingAI driver shared by the tests using the configured key."""
+    return LandingAIADEDriver(LandingAIConfig())
+
+
+@pytest.fixture(scope='module')
+def invalid_driver():
+    """Fixture providing a LandingAI driver configured with an invalid key."""
+    return LandingAIADEDriver(LandingAIConfig(api_key='invalid'))
+
+
+@pytest.fixture
+def mock_landingai(monkeypatch):
+    """Fixture replacing the LandingAI ADE client class, returning the client the driver receives."""
+    client = MagicMock()
+    monkeypatch.setattr('landingai_ade.LandingAIADE', Mock(return_value=client))
+    return client
+
+
 @pytest.mark.skipif(
     os.getenv('GITHUB_ACTIONS') == 'true',
     reason='External service required, skipping tests in GitHub Actions.',
 )
 class TestLandingAIADEDriver:
-    def __fixture_path(self, file: str) -> str:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        fixtures_dir = os.path.join(os.path.dirname(current_dir), 'fixtures')
-        return os.path.join(fixtures_dir, file)
-
-    def test_landingai_driver_can_be_created(self):
-        driver = LandingAIADEDriver(LandingAIConfig())
-
+    def test_landingai_driver_can_be_created(self, driver):
         assert driver.supported_levels == ['page', 'block']
 
-    def test_landingai_driver_handle_invalid_key(self):
-        driver = LandingAIADEDriver(LandingAIConfig(api_key='invalid'))
-
-        path = self.__fixture_path('empty-doc.pdf')
+    @pytest.mark.slow
+    def test_landingai_driver_handle_invalid_key(self, invalid_driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
 
         with pytest.raises(AuthenticationException) as excinfo:
-            driver.parse(path)
+            invalid_driver.parse(path)
 
-    def test_landingai_driver_handle_not_existing_file(self):
-        driver = LandingAIADEDriver(LandingAIConfig())
-
-        path = self.__fixture_path('non-existing-file.pdf')
+    def test_landingai_driver_handle_not_existing_file(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'non-existing-file.pdf')
 
         with pytest.raises(FileNotFoundException) as excinfo:
             driver.parse(path)
 
-    def test_landingai_driver_unrecognized_level_handled(self):
-        driver = LandingAIADEDriver(LandingAIConfig())
-
-        path = self.__fixture_path('empty-doc.pdf')
+    def test_landingai_driver_unrecognized_level_handled(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
 
         with pytest.raises(ValueError) as excinfo:
             driver.parse(path, level='custom')
@@ -58,10 +75,9 @@ class TestLandingAIADEDriver:
         assert 'not supported' in str(excinfo.value)
         assert '[custom]' in str(excinfo.value)
 
-    def test_landingai_driver_read_empty_document_block_level(self):
-        driver = LandingAIADEDriver(LandingAIConfig())
-
-        path = self.__fixture_path('empty-doc.pdf')
+    @pytest.mark.slow
+    def test_landingai_driver_read_empty_document_block_level(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path)
 
         assert document is not None
@@ -73,16 +89,15 @@ class TestLandingAIADEDriver:
         # The output contain a generated anchor tag like <a id='1e6096c7-6acf-4933-bdbc-a16f4264b4c2'></a>
         # we strip them before verifying the page content
         stripped_text = (
-            re.sub(r'<[^>]+>', '', document.pages[0].text).replace('\n', '').strip()
+            ANCHOR_PATTERN.sub('', document.pages[0].text).replace('\n', '').strip()
         )
         assert stripped_text == '1'
         assert len(document.pages[0].blocks) == 1
         assert isinstance(document.pages[0].blocks[0], TextBlock)
 
-    def test_landingai_driver_read_empty_document_page_level(self):
-        driver = LandingAIADEDriver(LandingAIConfig())
-
-        path = self.__fixture_path('empty-doc.pdf')
+    @pytest.mark.slow
+    def test_landingai_driver_read_empty_document_page_level(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path, level='page')
 
         assert document is not None
@@ -92,14 +107,13 @@ class TestLandingAIADEDriver:
         assert len(document.pages) == 1
         assert isinstance(document.pages[0], Page)
         stripped_text = (
-            re.sub(r'<[^>]+>', '', document.pages[0].text).replace('\n', '').strip()
+            ANCHOR_PATTERN.sub('', document.pages[0].text).replace('\n', '').strip()
         )
         assert stripped_text == '1'
 
-    def test_landingai_driver_read_document(self):
-        driver = LandingAIADEDriver(LandingAIConfig())
-
-        path = self.__fixture_path('test-doc.pdf')
+    @pytest.mark.slow
+    def test_landingai_driver_read_document(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path, level='page')
 
         assert document is not None
@@ -111,14 +125,15 @@ class TestLandingAIADEDriver:
 
         # The output contain a generated anchor tag like <a id='1e6096c7-6acf-4933-bdbc-a16f4264b4c2'></a>
         # we strip them before verifying the page content
-        stripped_text = re.sub(r'<[^>]+>', '', document.pages[0].text).strip()
+        stripped_text = ANCHOR_PATTERN.sub('', document.pages[0].text).strip()
         assert (
             stripped_text
             == 'This is the header\n\n\nThis is a test PDF to be used as input in unit tests\n\n\n# This is a heading 1\nThis is a paragraph below heading 1\n\n\n1'
         )
 
+    @pytest.mark.slow
     @patch('parxy_core.drivers.abstract_driver.tracer')
-    def test_landingai_driver_tracing_span_created(self, mock_tracer):
+    def test_landingai_driver_tracing_span_created(self, mock_tracer, driver):
         # Setup mocks for the span context manager
         mock_span = MagicMock()
         mock_span.__enter__ = Mock(return_value=mock_span)
@@ -127,8 +142,7 @@ class TestLandingAIADEDriver:
         mock_tracer.count = Mock()
         mock_tracer.info = Mock()
 
-        driver = LandingAIADEDriver(LandingAIConfig())
-        path = self.__fixture_path('empty-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path, level='block')
 
         # Verify tracer.span was called to create span
@@ -151,7 +165,7 @@ class TestLandingAIADEDriver:
         assert count_call[1]['driver'] == 'LandingAIADEDriver'
 
     @patch('parxy_core.drivers.abstract_driver.tracer')
-    def test_landingai_driver_tracing_exception_recorded(self, mock_tracer):
+    def test_landingai_driver_tracing_exception_recorded(self, mock_tracer, driver):
         # Setup mocks
         mock_span = MagicMock()
         mock_span.__enter__ = Mock(return_value=mock_span)
@@ -160,8 +174,7 @@ class TestLandingAIADEDriver:
         mock_tracer.count = Mock()
         mock_tracer.error = Mock()
 
-        driver = LandingAIADEDriver(LandingAIConfig())
-        path = self.__fixture_path('non-existing-file.pdf')
+        path = os.path.join(FIXTURES_DIR, 'non-existing-file.pdf')
 
         # Attempt to parse non-existing file
         with pytest.raises(FileNotFoundException):
@@ -178,9 +191,10 @@ class TestLandingAIADEDriver:
         assert count_call[0][0] == 'documents.failures'
         assert count_call[1]['driver'] == 'LandingAIADEDriver'
 
-    @patch('landingai_ade.LandingAIADE')
+
+class TestLandingAIADEDriverResponses:
     @patch('parxy_core.drivers.abstract_driver.tracer')
-    def test_landingai_driver_cost_estimation(self, mock_tracer, mock_client_class):
+    def test_landingai_driver_cost_estimation(self, mock_tracer, mock_landingai):
         """Test that cost estimation is extracted from parse response metadata"""
         # Setup tracing mocks
         mock_span = MagicMock()
@@ -190,70 +204,60 @@ class TestLandingAIADEDriver:
         mock_tracer.count = Mock()
         mock_tracer.info = Mock()
 
-        # Setup client mock
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
         # Mock parse response with metadata including credit usage
         # Based on https://docs.landing.ai/ade/ade-json-response.md
-        mock_metadata = MagicMock()
-        mock_metadata.credit_usage = 6.0
-        mock_metadata.duration_ms = 24382
-        mock_metadata.filename = 'test-document.pdf'
-        mock_metadata.job_id = 'td8wu72tq2g9l9tfgkwn3q3kp'
-        mock_metadata.page_count = 2
-        mock_metadata.version = 'dpt-2-20251103'
-        mock_metadata.model_dump = Mock(
-            return_value={
-                'credit_usage': 6.0,
-                'duration_ms': 24382,
-                'filename': 'test-document.pdf',
-                'job_id': 'td8wu72tq2g9l9tfgkwn3q3kp',
-                'page_count': 2,
-                'version': 'dpt-2-20251103',
-            }
+        metadata = {
+            'credit_usage': 6.0,
+            'duration_ms': 24382,
+            'filename': 'test-document.pdf',
+            'job_id': 'td8wu72tq2g9l9tfgkwn3q3kp',
+            'org_id': None,
+            'page_count': 2,
+            'version': 'dpt-2-20251103',
+            'failed_pages': None,
+        }
+        mock_metadata = SimpleNamespace(**metadata, model_dump=metadata.copy)
+
+        # Only the client needs call recording, the response is plain data
+        # shaped after the landingai_ade ParseResponse fields
+        mock_chunk_1 = SimpleNamespace(
+            id='chunk-1',
+            markdown='Page 1 content',
+            type='text',
+            grounding=SimpleNamespace(
+                page=0,
+                box=SimpleNamespace(left=0.1, top=0.1, right=0.9, bottom=0.5),
+            ),
+            model_dump=dict,
+        )
+
+        mock_chunk_2 = SimpleNamespace(
+            id='chunk-2',
+            markdown='Page 2 content',
+            type='text',
+            grounding=SimpleNamespace(
+                page=1,
+                box=SimpleNamespace(left=0.1, top=0.1, right=0.9, bottom=0.5),
+            ),
+            model_dump=dict,
+        )
+
+        mock_response = SimpleNamespace(
+            chunks=[mock_chunk_1, mock_chunk_2],
+            markdown='Page 1 content\n\nPage 2 content',
+            metadata=mock_metadata,
+            splits=[],
+            grounding=None,
+            model_dump=dict,
         )
 
-        mock_chunk_1 = MagicMock()
-        mock_chunk_1.markdown = 'Page 1 content'
-        mock_chunk_1.type = 'text'
-        mock_chunk_1.grounding = MagicMock()
-        mock_chunk_1.grounding.page = 0
-        mock_chunk_1.grounding.box = MagicMock()
-        mock_chunk_1.grounding.box.left = 0.1
-        mock_chunk_1.grounding.box.top = 0.1
-        mock_chunk_1.grounding.box.right = 0.9
-        mock_chunk_1.grounding.box.bottom = 0.5
-        mock_chunk_1.model_dump = Mock(return_value={})
-
-        mock_chunk_2 = MagicMock()
-        mock_chunk_2.markdown = 'Page 2 content'
-        mock_chunk_2.type = 'text'
-        mock_chunk_2.grounding = MagicMock()
-        mock_chunk_2.grounding.page = 1
-        mock_chunk_2.grounding.box = MagicMock()
-        mock_chunk_2.grounding.box.left = 0.1
-        mock_chunk_2.grounding.box.top = 0.1
-        mock_chunk_2.grounding.box.right = 0.9
-        mock_chunk_2.grounding.box.bottom = 0.5
-        mock_chunk_2.model_dump = Mock(return_value={})
-
-        mock_response_metadata = MagicMock()
-        mock_response_metadata.filename = 'test-document.pdf'
-        mock_response_metadata.model_dump = Mock(return_value={})
-
-        mock_response = MagicMock()
-        mock_response.chunks = [mock_chunk_1, mock_chunk_2]
-        mock_response.metadata = mock_metadata
-        mock_response.model_dump_json = Mock(return_value='{}')
-
-        mock_client.parse.return_value = mock_response
+        mock_landingai.parse.return_value = mock_response
 
         # Create driver
         driver = LandingAIADEDriver(LandingAIConfig())
 
         # Parse document
-        path = self.__fixture_path('test-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path)
 
         # Verify cost estimation metadata
@@ -272,10 +276,9 @@ class TestLandingAIADEDriver:
         assert ade_details['version'] == 'dpt-2-20251103'
 
     @patch('parxy_core.drivers.landingai.LandingAIADEDriver.handle_file_input')
-    @patch('landingai_ade.LandingAIADE')
     @patch('parxy_core.drivers.abstract_driver.tracer')
     def test_landingai_driver_handles_rate_limit_error(
-        self, mock_tracer, mock_client_class, mock_handle_file
+        self, mock_tracer, mock_handle_file, mock_landingai
     ):
         """Test that RateLimitError from the client raises RateLimitException"""
         from landingai_ade import RateLimitError
@@ -293,14 +296,11 @@ class TestLandingAIADEDriver:
         mock_handle_file.return_value = ('test.pdf', b'fake content')
 
         # Setup client to raise RateLimitError
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
         mock_response = Response(
             status_code=429,
             request=Request('POST', 'https://api.landing.ai/parse'),
         )
-        mock_client.parse.side_effect = RateLimitError(
+        mock_landingai.parse.side_effect = RateLimitError(
             'Rate limit exceeded',
             response=mock_response,
             body={'error': 'Rate limit exceeded'},
@@ -315,10 +315,9 @@ class TestLandingAIADEDriver:
         assert excinfo.value.service == 'LandingAIADEDriver'
 
     @patch('parxy_core.drivers.landingai.LandingAIADEDriver.handle_file_input')
-    @patch('landingai_ade.LandingAIADE')
     @patch('parxy_core.drivers.abstract_driver.tracer')
     def test_landingai_driver_handles_api_status_error_429(
-        self, mock_tracer, mock_client_class, mock_handle_file
+        self, mock_tracer, mock_handle_file, mock_landingai
     ):
         """Test that APIStatusError with 429 status raises RateLimitException"""
         from landingai_ade import APIStatusError
@@ -336,14 +335,11 @@ class TestLandingAIADEDriver:
         mock_handle_file.return_value = ('test.pdf', b'fake content')
 
         # Setup client to raise APIStatusError with 429
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
         mock_response = Response(
             status_code=429,
             request=Request('POST', 'https://api.landing.ai/parse'),
         )
-        mock_client.parse.side_effect = APIStatusError(
+        mock_landingai.parse.side_effect = APIStatusError(
             "Error code: 429 - {'error': 'Rate limit exceeded'}",
             response=mock_response,
             body={'error': 'Rate limit exceeded'},
@@ -358,10 +354,9 @@ class TestLandingAIADEDriver:
         assert excinfo.value.service == 'LandingAIADEDriver'
 
     @patch('parxy_core.drivers.landingai.LandingAIADEDriver.handle_file_input')
-    @patch('landingai_ade.LandingAIADE')
     @patch('parxy_core.drivers.abstract_driver.tracer')
     def test_landingai_driver_handles_api_status_error_402(
-        self, mock_tracer, mock_client_class, mock_handle_file
+        self, mock_tracer, mock_handle_file, mock_landingai
     ):
         """Test that APIStatusError with 402 status raises QuotaExceededException"""
         from landingai_ade import APIStatusError
@@ -379,14 +374,11 @@ class TestLandingAIADEDriver:
         mock_handle_file.return_value = ('test.pdf', b'fake content')
 
         # Setup client to raise APIStatusError with 402
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
         mock_response = Response(
             status_code=402,
             request=Request('POST', 'https://api.landing.ai/parse'),
         )
-        mock_client.parse.side_effect = APIStatusError(
+        mock_landingai.parse.side_effect = APIStatusError(
             "Error code: 402 - {'error': 'Payment Required. User balance is insufficient (including pending jobs).'}",
             response=mock_response,
             body={
@@ -403,10 +395,9 @@ class TestLandingAIADEDriver:
         assert excinfo.value.service == 'LandingAIADEDriver'
 
     @patch('parxy_core.drivers.landingai.LandingAIADEDriver.handle_file_input')
-    @patch('landingai_ade.LandingAIADE')
     @patch('parxy_core.drivers.abstract_driver.tracer')
     def test_landingai_driver_handles_api_status_error_422(
-        self, mock_tracer, mock_client_class, mock_handle_file
+        self, mock_tracer, mock_handle_file, mock_landingai
     ):
         """Test that APIStatusError with 422 status raises InputValidationException"""
         from landingai_ade import APIStatusError
@@ -424,14 +415,11 @@ class TestLandingAIADEDriver:
         mock_handle_file.return_value = ('test.pdf', b'fake content')
 
         # Setup client to raise APIStatusError with 422
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
         mock_response = Response(
             status_code=422,
             request=Request('POST', 'https://api.landing.ai/parse'),
         )
-        mock_client.parse.side_effect = APIStatusError(
+        mock_landingai.parse.side_effect = APIStatusError(
             "Error code: 422 - {'error': 'PDF must not exceed 100 pages.'}",
             response=mock_response,
             body={'error': 'PDF must not exceed 100 pages.'},
@@ -12,41 +12,46 @@ from parxy_core.drivers import LlamaParseDriver
 from parxy_core.models import LlamaParseConfig
 
 
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures'
+)
+
+
+@pytest.fixture(scope='module')
+def driver():
+    """Fixture providing a LlamaParse driver shared by the tests using the default configuration."""
+    return LlamaParseDriver(LlamaParseConfig())
+
+
+@pytest.fixture(scope='module')
+def invalid_driver():
+    """Fixture providing a LlamaParse driver configured with an invalid key."""
+    return LlamaParseDriver(LlamaParseConfig(api_key='invalid'))
+
+
 @pytest.mark.skipif(
     os.getenv('GITHUB_ACTIONS') == 'true',
     reason='External service required, skipping tests in GitHub Actions.',
 )
 class TestLlamaParseDriver:
-    def __fixture_path(self, file: str) -> str:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        fixtures_dir = os.path.join(os.path.dirname(current_dir), 'fixtures')
-        return os.path.join(fixtures_dir, file)
-
-    def test_llamaparse_driver_can_be_created(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
+    def test_llamaparse_driver_can_be_created(self, driver):
         assert driver.supported_levels == ['page', 'block']
 
-    def test_llamaparse_driver_handle_invalid_key(self):
-        driver = LlamaParseDriver(LlamaParseConfig(api_key='invalid'))
-
-        path = self.__fixture_path('empty-doc.pdf')
+    @pytest.mark.slow
+    def test_llamaparse_driver_handle_invalid_key(self, invalid_driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
 
         with pytest.raises(AuthenticationException):
-            driver.parse(path)
-
-    def test_llamaparse_driver_handle_not_existing_file(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
+            invalid_driver.parse(path)
 
-        path = self.__fixture_path('non-existing-file.pdf')
+    def test_llamaparse_driver_handle_not_existing_file(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'non-existing-file.pdf')
 
         with pytest.raises(FileNotFoundException):
             driver.parse(path)
 
-    def test_llamaparse_driver_unrecognized_level_handled(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
-        path = self.__fixture_path('empty-doc.pdf')
+    def test_llamaparse_driver_unrecognized_level_handled(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
 
         with pytest.raises(ValueError) as excinfo:
             driver.parse(path, level='custom')
@@ -54,10 +59,9 @@ class TestLlamaParseDriver:
         assert 'not supported' in str(excinfo.value)
         assert '[custom]' in str(excinfo.value)
 
-    def test_llamaparse_driver_read_empty_document_block_level(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
-        path = self.__fixture_path('empty-doc.pdf')
+    @pytest.mark.slow
+    def test_llamaparse_driver_read_empty_document_block_level(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path)
 
         assert document is not None
@@ -68,10 +72,9 @@ class TestLlamaParseDriver:
         assert isinstance(document.pages[0], Page)
         assert isinstance(document.pages[0].text, str)
 
-    def test_llamaparse_driver_read_empty_document_page_level(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
-        path = self.__fixture_path('empty-doc.pdf')
+    @pytest.mark.slow
+    def test_llamaparse_driver_read_empty_document_page_level(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path, level='page')
 
         assert document is not None
@@ -82,10 +85,9 @@ class TestLlamaParseDriver:
         assert isinstance(document.pages[0], Page)
         assert isinstance(document.pages[0].text, str)
 
-    def test_llamaparse_driver_read_document(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
-        path = self.__fixture_path('test-doc.pdf')
+    @pytest.mark.slow
+    def test_llamaparse_driver_read_document(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path, level='page')
 
         assert document is not None
@@ -98,10 +100,9 @@ class TestLlamaParseDriver:
         assert isinstance(document.pages[0].text, str)
         assert len(document.pages[0].text) > 0
 
-    def test_llamaparse_driver_read_document_as_blocks(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
-        path = self.__fixture_path('test-doc.pdf')
+    @pytest.mark.slow
+    def test_llamaparse_driver_read_document_as_blocks(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path, level='block')
 
         assert document is not None
@@ -109,8 +110,9 @@ class TestLlamaParseDriver:
         assert isinstance(document.pages[0].blocks, list)
         assert len(document.pages[0].blocks) > 0
 
+    @pytest.mark.slow
     @patch('parxy_core.drivers.abstract_driver.tracer')
-    def test_llamaparse_driver_tracing_span_created(self, mock_tracer):
+    def test_llamaparse_driver_tracing_span_created(self, mock_tracer, driver):
         # Setup mocks for the span context manager
         mock_span = MagicMock()
         mock_span.__enter__ = Mock(return_value=mock_span)
@@ -119,8 +121,7 @@ class TestLlamaParseDriver:
         mock_tracer.count = Mock()
         mock_tracer.info = Mock()
 
-        driver = LlamaParseDriver(LlamaParseConfig())
-        path = self.__fixture_path('empty-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path, level='block')
 
         # Verify tracer.span was called to create span
@@ -143,7 +144,7 @@ class TestLlamaParseDriver:
         assert count_call[1]['driver'] == 'LlamaParseDriver'
 
     @patch('parxy_core.drivers.abstract_driver.tracer')
-    def test_llamaparse_driver_tracing_exception_recorded(self, mock_tracer):
+    def test_llamaparse_driver_tracing_exception_recorded(self, mock_tracer, driver):
         # Setup mocks
         mock_span = MagicMock()
         mock_span.__enter__ = Mock(return_value=mock_span)
@@ -152,8 +153,7 @@ class TestLlamaParseDriver:
         mock_tracer.count = Mock()
         mock_tracer.error = Mock()
 
-        driver = LlamaParseDriver(LlamaParseConfig())
-        path = self.__fixture_path('non-existing-file.pdf')
+        path = os.path.join(FIXTURES_DIR, 'non-existing-file.pdf')
 
         # Attempt to parse non-existing file
         with pytest.raises(FileNotFoundException):
@@ -170,10 +170,9 @@ class TestLlamaParseDriver:
         assert count_call[0][0] == 'documents.failures'
         assert count_call[1]['driver'] == 'LlamaParseDriver'
 
-    def test_llamaparse_driver_parsing_metadata_populated(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
-        path = self.__fixture_path('test-doc.pdf')
+    @pytest.mark.slow
+    def test_llamaparse_driver_parsing_metadata_populated(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path, level='block')
 
         assert document.parsing_metadata is not None
@@ -188,20 +187,20 @@ class TestLlamaParseDriver:
         assert 'cost_estimation_unit' in document.parsing_metadata
         assert document.parsing_metadata['cost_estimation_unit'] == 'credits'
 
+    @pytest.mark.slow
     def test_llamaparse_driver_legacy_parse_mode_maps_to_tier(self):
         driver = LlamaParseDriver(LlamaParseConfig(parse_mode='parse_page_with_llm'))
 
-        path = self.__fixture_path('test-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path, level='page')
 
         assert document is not None
         assert document.parsing_metadata is not None
         assert document.parsing_metadata.get('tier') == 'cost_effective'
 
-    def test_llamaparse_driver_tier_override_per_call(self):
-        driver = LlamaParseDriver(LlamaParseConfig())
-
-        path = self.__fixture_path('test-doc.pdf')
+    @pytest.mark.slow
+    def test_llamaparse_driver_tier_override_per_call(self, driver):
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path, level='page', tier='fast')
 
         assert document is not None
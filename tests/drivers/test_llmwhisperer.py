@@ -15,25 +15,26 @@ from parxy_core.drivers import LlmWhispererDriver
 from parxy_core.models import LlmWhispererConfig
 
 
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures'
+)
+
+
 @pytest.mark.skipif(
     os.getenv('GITHUB_ACTIONS') == 'true',
     reason='External service required, skipping tests in GitHub Actions.',
 )
 class TestLlmWhispererDriver:
-    def __fixture_path(self, file: str) -> str:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        fixtures_dir = os.path.join(os.path.dirname(current_dir), 'fixtures')
-        return os.path.join(fixtures_dir, file)
-
     def test_llmwhisperer_driver_can_be_created(self):
         driver = LlmWhispererDriver(LlmWhispererConfig())
 
         assert driver.supported_levels == ['page', 'block']
 
+    @pytest.mark.slow
     def test_llmwhisperer_driver_handle_invalid_key(self):
         driver = LlmWhispererDriver(LlmWhispererConfig(api_key='invalid'))
 
-        path = self.__fixture_path('empty-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
 
         with pytest.raises(AuthenticationException) as excinfo:
             driver.parse(path)
@@ -41,7 +42,7 @@ class TestLlmWhispererDriver:
     def test_llmwhisperer_driver_handle_not_existing_file(self):
         driver = LlmWhispererDriver(LlmWhispererConfig())
 
-        path = self.__fixture_path('non-existing-file.pdf')
+        path = os.path.join(FIXTURES_DIR, 'non-existing-file.pdf')
 
         with pytest.raises(FileNotFoundException) as excinfo:
             driver.parse(path)
@@ -49,7 +50,7 @@ class TestLlmWhispererDriver:
     def test_llmwhisperer_driver_unrecognized_level_handled(self):
         driver = LlmWhispererDriver(LlmWhispererConfig())
 
-        path = self.__fixture_path('empty-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
 
         with pytest.raises(ValueError) as excinfo:
             driver.parse(path, level='custom')
@@ -57,10 +58,11 @@ class TestLlmWhispererDriver:
         assert 'not supported' in str(excinfo.value)
         assert '[custom]' in str(excinfo.value)
 
+    @pytest.mark.slow
     def test_llmwhisperer_driver_read_empty_document_page_level(self):
         driver = LlmWhispererDriver(LlmWhispererConfig())
 
-        path = self.__fixture_path('empty-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path, level='page')
 
         assert document is not None
@@ -71,10 +73,11 @@ class TestLlmWhispererDriver:
         assert isinstance(document.pages[0], Page)
         assert document.pages[0].text == '\n\n1 \n'
 
+    @pytest.mark.slow
     def test_llmwhisperer_driver_read_document(self):
         driver = LlmWhispererDriver(LlmWhispererConfig())
 
-        path = self.__fixture_path('test-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'test-doc.pdf')
         document = driver.parse(path, level='page')
 
         assert document is not None
@@ -89,6 +92,7 @@ class TestLlmWhispererDriver:
             == '\n\nThis is the header \n\nThis is a test PDF to be used as input in unit \n\ntests \n\nThis is a heading 1 \nThis is a paragraph below heading 1 \n\n                                                       1 \n'
         )
 
+    @pytest.mark.slow
     @patch('parxy_core.drivers.abstract_driver.tracer')
     def test_llmwhisperer_driver_tracing_span_created(self, mock_tracer):
         # Setup mocks for the span context manager
@@ -100,7 +104,7 @@ class TestLlmWhispererDriver:
         mock_tracer.info = Mock()
 
         driver = LlmWhispererDriver(LlmWhispererConfig())
-        path = self.__fixture_path('empty-doc.pdf')
+        path = os.path.join(FIXTURES_DIR, 'empty-doc.pdf')
         document = driver.parse(path, level='page')
 
         # Verify tracer.span was called to create span
@@ -133,7 +137,7 @@ class TestLlmWhispererDriver:
         mock_tracer.error = Mock()
 
         driver = LlmWhispererDriver(LlmWhispererConfig())
-        path = self.__fixture_path('non-existing-file.pdf')
+        path = os.path.join(FIXTURES_DIR, 'non-existing-file.pdf')
 
         # Attempt to parse non-existing file
         with pytest.raises(FileNotFoundException):
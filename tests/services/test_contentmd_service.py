@@ -63,13 +63,13 @@ def make_doc(
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def minimal_doc():
     """Document with a single page, no blocks, no metadata."""
     return make_doc(pages=[make_page(text='Hello world')])
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def metadata_doc():
     """Document with full metadata and one plain paragraph block."""
     meta = Metadata(
@@ -84,7 +84,7 @@ def metadata_doc():
     return make_doc(pages=[page], metadata=meta, filename='report.pdf')
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def all_blocks_doc():
     """Document whose first page contains every supported block type."""
     blocks = [
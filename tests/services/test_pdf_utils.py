@@ -1,8 +1,12 @@
 """Test suite for PDF utility functions."""
 
+import re
+from unittest.mock import Mock
+
 import pytest
 from pathlib import Path
 
+from parxy_cli.services import pdf_utils
 from parxy_cli.services.pdf_utils import (
     format_file_size,
     validate_pdf_file,
@@ -99,6 +103,11 @@ class TestIsBinaryFile:
         long_text = ('a' * 10000).encode('utf-8')
         assert not is_binary_file(long_text)
 
+    def test_is_binary_file_checks_first_8kb_only(self):
+        """Test null bytes after the first 8KB are not considered."""
+        assert is_binary_file(b'a' * 8191 + b'\x00')
+        assert not is_binary_file(b'a' * 8192 + b'\x00')
+
 
 # Tests for parse_input_with_pages
 class TestParseInputWithPages:
@@ -155,6 +164,16 @@ class TestParseInputWithPages:
         assert from_page is None
         assert to_page is None
 
+    def test_pattern_is_compiled_once(self, monkeypatch):
+        """Test parsing uses the precompiled module level pattern."""
+        assert isinstance(pdf_utils.PAGE_RANGE_PATTERN, re.Pattern)
+
+        spy = Mock(wraps=pdf_utils.PAGE_RANGE_PATTERN)
+        monkeypatch.setattr(pdf_utils, 'PAGE_RANGE_PATTERN', spy)
+
+        assert parse_input_with_pages('file.pdf[2:5]') == ('file.pdf', 1, 4)
+        spy.match.assert_called_once_with('file.pdf[2:5]')
+
 
 # Tests for collect_pdf_files_with_ranges
 class TestCollectPdfFilesWithRanges: